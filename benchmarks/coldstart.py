@@ -0,0 +1,181 @@
+"""
+Cold start benchmark of importing zero_settings and creating ZeroSettings objects.
+
+Runs each case many times, each time in a fresh Python process with
+-X importtime, and reports median milliseconds of importing zero_settings,
+from importtime output, and of creating a settings object with and without
+pre checks, for different numbers of import strings of distinct generated
+modules. Django is set up before, so its import time is not measured, and
+the first run of each case only writes bytecode. Results are checked against
+baselines.json, run with --update to store current results as baselines.
+
+    $ python coldstart.py
+    $ python coldstart.py --update
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+IMPORT_STRINGS = (0, 10, 100)
+MODULE = """
+import collections
+
+VALUE = %d
+
+
+def function(value):
+    return collections.OrderedDict(value=value)
+
+
+class Class:
+    def __init__(self, value=VALUE):
+        self.value = value
+"""
+
+
+def create_modules(path, size):
+    """
+    Create size distinct modules in path, so each import string imports a module
+    """
+    for i in range(size):
+        with open(os.path.join(path, "coldstart_module_%d.py" % i), "w") as f:
+            f.write(MODULE % i)
+
+
+def get_defaults(size):
+    """
+    Return defaults with size import strings of distinct modules and as many other settings
+    """
+    defaults = {}
+    for i in range(size):
+        defaults["KEY_%d" % i] = "value_%d" % i
+        defaults["IMPORT_%d" % i] = "coldstart_module_%d.Class" % i
+    return defaults
+
+
+def measure(size, pre_check, modules_path):
+    """
+    Print seconds of creating a settings object, to be run in a fresh process
+    """
+    sys.path.insert(0, modules_path)
+
+    import django
+    from django.conf import settings as django_settings
+
+    django_settings.configure()
+    django.setup()
+
+    from zero_settings import ZeroSettings
+
+    defaults = get_defaults(size)
+    start = time.perf_counter()
+    ZeroSettings(
+        key="BENCHMARK",
+        defaults=defaults,
+        import_strings=[key for key in defaults if key.startswith("IMPORT_")],
+        pre_check_defaults=pre_check,
+        pre_check_imports=pre_check,
+        pre_check_removed=pre_check,
+    )
+    print(time.perf_counter() - start)
+
+
+def parse_import_time(output, module):
+    """
+    Return cumulative seconds of importing module from -X importtime output
+    """
+    for line in output.splitlines():
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+            return int(line.split("|")[1]) / 1000000
+    raise ValueError("no import time of '%s' found" % module)
+
+
+def run_case(name, modules_path):
+    """
+    Return seconds of importing zero_settings and of case, in a fresh process
+    """
+    # bytecode is written, so runs after the first one measure cached bytecode
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--case", name, "--modules", modules_path],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        env=env,
+    )
+    return parse_import_time(process.stderr, "zero_settings"), float(process.stdout)
+
+
+def run(runs):
+    """
+    Return median milliseconds of all cases by name, first run of each case
+    only writes bytecode and is not measured
+    """
+    timings = {}
+    with tempfile.TemporaryDirectory() as modules_path:
+        create_modules(modules_path, max(IMPORT_STRINGS))
+        for size in IMPORT_STRINGS:
+            for mode in ("precheck", "noprecheck"):
+                name = "%s/%d" % (mode, size)
+                run_case(name, modules_path)
+                for _ in range(runs):
+                    import_time, construct_time = run_case(name, modules_path)
+                    timings.setdefault("import", []).append(import_time)
+                    timings.setdefault(name, []).append(construct_time)
+    return {name: statistics.median(values) * 1000 for name, values in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update", action="store_true", help="store results as baselines")
+    parser.add_argument("--runs", type=int, default=20, help="number of runs of each case, default 20")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression ratio, default 0.25")
+    parser.add_argument(
+        "--min-delta", type=float, default=0.5, help="allowed regression in ms regardless of ratio, default 0.5"
+    )
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--modules", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        mode, size = args.case.split("/")
+        measure(int(size), pre_check=mode == "precheck", modules_path=args.modules)
+        return
+
+    with open(BASELINES) as f:
+        baselines = json.load(f)
+    coldstart_baselines = baselines.get("coldstart", {})
+
+    results = run(args.runs)
+    failed = []
+    for name, milliseconds in sorted(results.items()):
+        baseline = coldstart_baselines.get(name)
+        status = ""
+        if baseline is not None:
+            status = "(baseline %.3f)" % baseline
+            if milliseconds > max(baseline * (1 + args.tolerance), baseline + args.min_delta):
+                status += " REGRESSION"
+                failed.append(name)
+        print("%-16s %10.3f ms %s" % (name, milliseconds, status))
+
+    if args.update:
+        baselines["coldstart"] = {name: round(value, 3) for name, value in sorted(results.items())}
+        with open(BASELINES, "w") as f:
+            json.dump(baselines, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print("baselines updated")
+    elif failed:
+        print("cold start regression in: %s" % ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
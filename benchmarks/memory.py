@@ -0,0 +1,160 @@
+"""
+Memory footprint benchmark of ZeroSettings objects.
+
+Builds settings objects of different sizes, gets all of their keys, and
+measures memory allocated by ZeroSettings with tracemalloc, excluding
+defaults which are created before tracing, and allocations of an empty
+settings object, which are per object and not per key. Results are
+reported as bytes per key and checked against baselines.json, run with
+--update to store current results as baselines.
+
+    $ python memory.py
+    $ python memory.py --update
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import django
+from django.conf import settings as django_settings
+
+if not django_settings.configured:
+    django_settings.configure()
+    django.setup()
+
+from zero_settings import ZeroSettings  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+SIZES = (100, 1000, 5000)
+MODES = ("cached", "uncached", "imports")
+IMPORTS = (
+    "collections.OrderedDict",
+    "collections.namedtuple",
+    "os.path.join",
+    "json.dumps",
+    "json.loads",
+)
+
+
+def get_defaults(size, imports=False):
+    """
+    Return defaults with size keys of strings, lists and dicts,
+    or import strings and lists of import strings
+    """
+    defaults = {}
+    for i in range(size):
+        key = "KEY_%d" % i
+        if imports:
+            if i % 2:
+                defaults[key] = IMPORTS[i % len(IMPORTS)]
+            else:
+                defaults[key] = list(IMPORTS)
+        elif i % 3 == 0:
+            defaults[key] = "value_%d" % i
+        elif i % 3 == 1:
+            defaults[key] = ["item_%d_%d" % (i, j) for j in range(10)]
+        else:
+            defaults[key] = {"key_%d" % j: j for j in range(10)}
+    return defaults
+
+
+def allocate(defaults, use_cache, imports):
+    """
+    Return bytes allocated by a settings object of defaults after getting all keys
+    """
+    tracemalloc.start()
+    app_settings = ZeroSettings(
+        key="BENCHMARK",
+        defaults=defaults,
+        import_strings=list(defaults) if imports else None,
+        use_cache=use_cache,
+        pre_check_imports=False,
+    )
+    for key in defaults:
+        getattr(app_settings, key)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del app_settings
+    gc.collect()
+    return current
+
+
+def measure(size, use_cache, imports):
+    """
+    Return bytes per key allocated by a settings object after getting all keys,
+    excluding allocations of an empty settings object, which are per object
+    """
+    defaults = get_defaults(size, imports)
+
+    # warm up with a small object, so one time allocations of Django and
+    # imports are not measured
+    allocate(get_defaults(10, imports), use_cache, imports)
+
+    empty = allocate({}, use_cache, imports)
+    return (allocate(defaults, use_cache, imports) - empty) / size
+
+
+def run():
+    """
+    Return results of all cases by name, each case is measured in a fresh
+    process, so allocations of previous cases do not affect it
+    """
+    results = {}
+    for size in SIZES:
+        for mode in MODES:
+            name = "%s/%d" % (mode, size)
+            output = subprocess.check_output([sys.executable, os.path.abspath(__file__), "--case", name])
+            results[name] = float(output)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update", action="store_true", help="store results as baselines")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed regression ratio, default 0.1")
+    parser.add_argument(
+        "--min-delta", type=float, default=1.0, help="allowed regression in bytes/key regardless of ratio, default 1"
+    )
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        mode, size = args.case.split("/")
+        print(measure(int(size), use_cache=mode != "uncached", imports=mode == "imports"))
+        return
+
+    with open(BASELINES) as f:
+        baselines = json.load(f)
+    memory_baselines = baselines.get("memory", {})
+
+    results = run()
+    failed = []
+    for name, bytes_per_key in sorted(results.items()):
+        baseline = memory_baselines.get(name)
+        status = ""
+        if baseline is not None:
+            status = "(baseline %.1f)" % baseline
+            if bytes_per_key > max(baseline * (1 + args.tolerance), baseline + args.min_delta):
+                status += " REGRESSION"
+                failed.append(name)
+        print("%-16s %10.1f bytes/key %s" % (name, bytes_per_key, status))
+
+    if args.update:
+        baselines["memory"] = {name: round(value, 1) for name, value in sorted(results.items())}
+        with open(BASELINES, "w") as f:
+            json.dump(baselines, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print("baselines updated")
+    elif failed:
+        print("memory regression in: %s" % ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Pre-fork warm up benchmark of ZeroSettings objects, Linux only.
+
+Creates a settings object in master process, optionally warms it up with
+warm(), with and without gc.freeze(), then forks workers which get all keys
+and run a gc collection, like a worker serving its first requests. Reports
+memory that each worker had to copy from master (Private_Dirty of
+/proc/self/smaps_rollup) and its RSS.
+
+    $ python prefork.py
+"""
+import argparse
+import gc
+import os
+import sys
+
+from memory import get_defaults
+from zero_settings import ZeroSettings
+
+
+def read_memory():
+    """
+    Return private dirty and rss memory of current process in kB
+    """
+    memory = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name in ("Private_Dirty", "Rss"):
+                memory[name] = int(value.split()[0])
+    return memory["Private_Dirty"], memory["Rss"]
+
+
+def run_worker(app_settings, keys, write_fd):
+    """
+    Get all keys, collect garbage and write memory usage to master
+    """
+    before, _ = read_memory()
+    for key in keys:
+        getattr(app_settings, key)
+    gc.collect()
+    after, rss = read_memory()
+    os.write(write_fd, ("%d %d\n" % (after - before, rss)).encode())
+    os._exit(0)
+
+
+def run(size, workers, warm, freeze):
+    """
+    Return list of (copied kB, rss kB) of workers
+    """
+    defaults = get_defaults(size)
+    defaults.update(("IMPORT_%s" % key, value) for key, value in get_defaults(size // 10, imports=True).items())
+    import_strings = [key for key in defaults if key.startswith("IMPORT_")]
+    app_settings = ZeroSettings(key="BENCHMARK", defaults=defaults, import_strings=import_strings)
+    if warm:
+        app_settings.warm(freeze=freeze)
+
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            run_worker(app_settings, list(defaults), write_fd)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            copied, rss = f.read().split()
+        os.waitpid(pid, 0)
+        results.append((int(copied), int(rss)))
+
+    if freeze and hasattr(gc, "unfreeze"):
+        gc.unfreeze()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=5000, help="number of settings keys, default 5000")
+    parser.add_argument("--workers", type=int, default=4, help="number of forked workers, default 4")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("prefork benchmark requires Linux /proc/self/smaps_rollup")
+        sys.exit(1)
+
+    for name, warm, freeze in (("cold", False, False), ("warm", True, False), ("warm+freeze", True, True)):
+        results = run(args.size, args.workers, warm, freeze)
+        copied = sum(result[0] for result in results) / len(results)
+        rss = sum(result[1] for result in results) / len(results)
+        print("%-12s copied %8.0f kB/worker, rss %8.0f kB/worker" % (name, copied, rss))
+
+
+if __name__ == "__main__":
+    main()
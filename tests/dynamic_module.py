@@ -0,0 +1,3 @@
+NAMES = ("FIRST", "SECOND")
+
+globals().update({name: name.lower() for name in NAMES})
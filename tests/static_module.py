@@ -0,0 +1,29 @@
+import os.path as path
+
+try:
+    from json import dumps
+except ImportError:
+    dumps = None
+
+if path:
+    CONSTANT, (OTHER_CONSTANT, *REST) = 1, (2, 3)
+
+
+class StaticClass:
+    pass
+
+
+def static_method():
+    return "static_method"
+
+
+for LOOP_NAME, *LOOP_REST in [(1, 2)]:
+    pass
+
+with open(__file__) as (OPENED_FILE):
+    pass
+
+try:
+    import not_exists
+except ImportError as IMPORT_ERROR:
+    pass
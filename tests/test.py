@@ -1,5 +1,23 @@
+import ast
+import asyncio
+import base64
+import copy
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from unittest import mock, skipUnless
+
 from django.test import TestCase, override_settings, tag
-from zero_settings import ZeroSettings
+from zero_settings import ZeroSettings, Computed, Conditional, Factory, JsonLinesSource, KeyfileDecryptor, Secret, SettingHandle
+from zero_settings.imports import _statements_names
+
+try:
+    from cryptography.fernet import Fernet
+except ImportError:
+    Fernet = None
 
 
 class TestZeroSettings(TestCase):
@@ -103,7 +121,7 @@ class TestZeroSettings(TestCase):
         Test wrong user_settings values
         """
         for user_settings in (["0"], ("0",), "string", 123, 123.4):
-            with self.assertRaisesMessage(ValueError, "user_settings must be dict or None"):
+            with self.assertRaisesMessage(ValueError, "user_settings must be dict, mapping or None"):
                 ZeroSettings(key="APP", defaults={}, user_settings=user_settings)
 
     @tag("args", "use_cache")
@@ -151,6 +169,118 @@ class TestZeroSettings(TestCase):
             with self.assertRaisesMessage(ValueError, "pre_check_removed must be boolean"):
                 ZeroSettings(key="APP", defaults={}, pre_check_removed=pre_check_removed)
 
+    @tag("args", "lazy")
+    def test_args_lazy(self):
+        """
+        Test wrong lazy values
+        """
+        for lazy in (["0"], ("0",), {1: 2}, "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "lazy must be boolean"):
+                ZeroSettings(key="APP", defaults={}, lazy=lazy)
+
+    @tag("args", "max_tenants")
+    def test_args_max_tenants(self):
+        """
+        Test wrong max_tenants values
+        """
+        for max_tenants in (["0"], ("0",), {1: 2}, "string", 0, -1, 123.4, True):
+            with self.assertRaisesMessage(ValueError, "max_tenants must be positive integer"):
+                ZeroSettings(key="APP", defaults={}, max_tenants=max_tenants)
+
+    @tag("args", "instantiate_strings")
+    def test_args_instantiate_strings(self):
+        """
+        Test wrong instantiate_strings values
+        """
+        for instantiate_strings in (["0"], ("0",), "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "instantiate_strings must be dict of setting: kwargs or None"):
+                ZeroSettings(key="APP", defaults={}, instantiate_strings=instantiate_strings)
+        with self.assertRaisesMessage(ValueError, "instantiate_strings settings must be in import_strings"):
+            ZeroSettings(key="APP", defaults={}, instantiate_strings={"BACKEND": None})
+        with self.assertRaisesMessage(ValueError, "instantiate_strings kwargs must be dict or None"):
+            ZeroSettings(
+                key="APP",
+                defaults={"BACKEND": "utils.TestBackend"},
+                import_strings=["BACKEND"],
+                instantiate_strings={"BACKEND": ["0"]},
+            )
+
+    @tag("args", "merge_strategies")
+    def test_args_merge_strategies(self):
+        """
+        Test wrong merge_strategies values
+        """
+        for merge_strategies in (["0"], ("0",), "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "merge_strategies must be dict of setting: strategy or None"):
+                ZeroSettings(key="APP", defaults={}, merge_strategies=merge_strategies)
+        with self.assertRaisesMessage(ValueError, "merge_strategies values must be one of: merge, replace, append"):
+            ZeroSettings(key="APP", defaults=self.DEFAULTS, merge_strategies={"DICT": "update"})
+        with self.assertRaisesMessage(ValueError, "merge_strategies settings must be in defaults"):
+            ZeroSettings(key="APP", defaults=self.DEFAULTS, merge_strategies={"NO_KEY": "merge"})
+        with self.assertRaisesMessage(ValueError, "merge strategy requires dict default for setting 'LIST'"):
+            ZeroSettings(key="APP", defaults=self.DEFAULTS, merge_strategies={"LIST": "merge"})
+        with self.assertRaisesMessage(ValueError, "append strategy requires list/tuple default for setting 'DICT'"):
+            ZeroSettings(key="APP", defaults=self.DEFAULTS, merge_strategies={"DICT": "append"})
+
+    @tag("args", "slow_access_hook")
+    def test_args_slow_access_hook(self):
+        """
+        Test wrong slow_access_hook and slow_access_threshold values
+        """
+        for slow_access_hook in (["0"], ("0",), {1: 2}, "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "slow_access_hook must be callable, logger or None"):
+                ZeroSettings(key="APP", defaults={}, slow_access_hook=slow_access_hook)
+        for slow_access_threshold in (["0"], ("0",), {1: 2}, "string", None, 0, -1, True):
+            with self.assertRaisesMessage(ValueError, "slow_access_threshold must be positive number"):
+                ZeroSettings(key="APP", defaults={}, slow_access_threshold=slow_access_threshold)
+
+    @tag("args", "secret_decryptor")
+    def test_args_secret_decryptor(self):
+        """
+        Test wrong secret_decryptor and Secret values
+        """
+        for secret_decryptor in (["0"], ("0",), {1: 2}, "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "secret_decryptor must be callable or None"):
+                ZeroSettings(key="APP", defaults={}, secret_decryptor=secret_decryptor)
+        for ciphertext in (["0"], ("0",), {1: 2}, None, 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "ciphertext must be string or bytes"):
+                Secret(ciphertext)
+        for ttl in (["0"], ("0",), {1: 2}, "string", 0, -1, True):
+            with self.assertRaisesMessage(ValueError, "ttl must be positive number or None"):
+                Secret("ciphertext", ttl=ttl)
+
+    @tag("args", "freeze_values")
+    def test_args_freeze_values(self):
+        """
+        Test wrong freeze_values values
+        """
+        for freeze_values in (["0"], ("0",), {1: 2}, "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "freeze_values must be boolean"):
+                ZeroSettings(key="APP", defaults={}, freeze_values=freeze_values)
+
+    @tag("args", "static_import_check")
+    def test_args_static_import_check(self):
+        """
+        Test wrong static_import_check values
+        """
+        for static_import_check in (["0"], ("0",), {1: 2}, "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "static_import_check must be boolean"):
+                ZeroSettings(key="APP", defaults={}, static_import_check=static_import_check)
+
+    @tag("args", "cache_ttl", "cache_ttls")
+    def test_args_cache_ttl(self):
+        """
+        Test wrong cache_ttl and cache_ttls values
+        """
+        for cache_ttl in (["0"], ("0",), {1: 2}, "string", 0, -1, True):
+            with self.assertRaisesMessage(ValueError, "cache_ttl must be positive number or None"):
+                ZeroSettings(key="APP", defaults={}, cache_ttl=cache_ttl)
+        for cache_ttls in (["0"], ("0",), "string", 123, 123.4):
+            with self.assertRaisesMessage(ValueError, "cache_ttls must be dict of setting: ttl or None"):
+                ZeroSettings(key="APP", defaults={}, cache_ttls=cache_ttls)
+        with self.assertRaisesMessage(ValueError, "cache_ttls values must be positive number or None"):
+            ZeroSettings(key="APP", defaults={}, cache_ttls={"KEY": 0})
+
     @tag(
         "props",
         "has_default",
@@ -1059,3 +1189,1278 @@ class TestZeroSettings(TestCase):
         with self.settings(APP={"VALUE": "new_value"}):
             app_settings._clear_cache()
             self.assertEqual(app_settings.VALUE, "new_value")
+
+    @tag(
+        "attrs",
+        "lazy",
+        "import_strings",
+        "pre_check_imports",
+    )
+    @override_settings(APP={"IMPORT": "utils.NotExists"})
+    def test_lazy_defers_pre_checks(self):
+        """
+        Test lazy settings defer pre checks until first access
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            import_strings=self.IMPORT_STRINGS,
+            lazy=True,
+        )
+        self.assertFalse(app_settings._is_setup)
+        with self.assertRaises(ImportError):
+            app_settings.KEY
+        self.assertFalse(app_settings._is_setup)
+
+    @tag(
+        "attrs",
+        "lazy",
+        "removed_settings",
+        "pre_check_removed",
+    )
+    @override_settings(APP={"REMOVED": "value"})
+    def test_lazy_explicit_setup(self):
+        """
+        Test lazy settings run pre checks on explicit setup
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            removed_settings={"REMOVED": None},
+            lazy=True,
+        )
+        with self.assertRaisesMessage(RuntimeError, "The 'APP.REMOVED' setting has been removed."):
+            app_settings._setup()
+
+    @tag("attrs", "lazy")
+    def test_lazy_setup_once(self):
+        """
+        Test lazy settings run pre checks only once across threads
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS, lazy=True)
+        calls = []
+        pre_check = app_settings._pre_check
+
+        def counted_pre_check():
+            calls.append(1)
+            pre_check()
+
+        app_settings._pre_check = counted_pre_check
+        threads = [threading.Thread(target=lambda: app_settings.KEY) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        app_settings._setup()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(app_settings.KEY, self.DEFAULTS["KEY"])
+
+    @tag("attrs", "tenants", "import_strings")
+    def test_tenant_overrides(self):
+        """
+        Test tenant views read overrides and share other keys with base settings
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS, import_strings=self.IMPORT_STRINGS)
+        tenant_settings = app_settings.for_tenant("tenant", {"VALUE": "tenant_value", "IMPORT": "utils.test_method_1"})
+        self.assertEqual(tenant_settings.VALUE, "tenant_value")
+        self.assertEqual(tenant_settings.IMPORT(), "test_method_1")
+        self.assertIs(tenant_settings.IMPORT_LIST, app_settings.IMPORT_LIST)
+        self.assertEqual(app_settings.VALUE, self.DEFAULTS["VALUE"])
+        self.assertNotIn("IMPORT_LIST", tenant_settings.__dict__)
+        self.assertIs(app_settings.for_tenant("tenant"), tenant_settings)
+
+    @tag("attrs", "tenants", "strict_defaults", "removed_settings")
+    def test_tenant_overrides_pre_checked(self):
+        """
+        Test tenant overrides are pre checked for defaults and removed settings
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            removed_settings={"REMOVED": None},
+        )
+        with self.assertRaisesMessage(AttributeError, "Invalid setting: 'APP.NOT_DEFAULT'"):
+            app_settings.for_tenant("tenant", {"NOT_DEFAULT": "not_default"})
+        with self.assertRaisesMessage(RuntimeError, "The 'APP.REMOVED' setting has been removed."):
+            app_settings.for_tenant("tenant", {"REMOVED": "value"})
+
+    @tag("attrs", "tenants", "max_tenants")
+    def test_tenant_lru(self):
+        """
+        Test tenant views are evicted least recently used first and accounted
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS, max_tenants=2)
+        tenant_1 = app_settings.for_tenant(1, {"VALUE": "value_1"})
+        app_settings.for_tenant(2, {"VALUE": "value_2"})
+        self.assertIs(app_settings.for_tenant(1), tenant_1)
+        app_settings.for_tenant(3, {"VALUE": "value_3"})
+        stats = app_settings.tenant_stats()
+        self.assertEqual(stats["tenants"], 2)
+        self.assertEqual(stats["nbytes"], tenant_1._nbytes * 2)
+        self.assertIs(app_settings.for_tenant(1), tenant_1)
+        self.assertIsNot(app_settings.for_tenant(2), tenant_1)
+        self.assertEqual(app_settings.for_tenant(2).VALUE, self.DEFAULTS["VALUE"])
+
+    @tag("attrs", "tenants", "cache")
+    def test_tenant_clear_cache(self):
+        """
+        Test clear cache of base settings clears tenant views cache
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS)
+        tenant_settings = app_settings.for_tenant("tenant", {"VALUE": "tenant_value"})
+        tenant_settings.VALUE
+        self.assertIn("VALUE", tenant_settings.__dict__)
+        app_settings._clear_cache()
+        self.assertNotIn("VALUE", tenant_settings.__dict__)
+        self.assertEqual(tenant_settings.VALUE, "tenant_value")
+
+    @tag("attrs", "computed", "cache")
+    def test_computed(self):
+        """
+        Test computed settings are computed once and cached
+        """
+        calls = []
+
+        def url(host, port):
+            calls.append((host, port))
+            return "http://%s:%s" % (host, port)
+
+        defaults = {
+            "HOST": "localhost",
+            "PORT": 8000,
+            "URL": Computed(url, depends_on=["HOST", "PORT"]),
+            "URL_UPPER": Computed(lambda url: url.upper(), depends_on=["URL"]),
+        }
+        app_settings = ZeroSettings(key="APP", defaults=defaults, user_settings={"PORT": 8080})
+        self.assertEqual(app_settings.URL, "http://localhost:8080")
+        self.assertEqual(app_settings.URL_UPPER, "HTTP://LOCALHOST:8080")
+        self.assertEqual(app_settings.URL, "http://localhost:8080")
+        self.assertEqual(len(calls), 1)
+
+    @tag("attrs", "computed", "cache")
+    def test_computed_clear_cache(self):
+        """
+        Test computed settings are removed from cache only with their dependencies
+        """
+        defaults = {
+            "KEY": "key",
+            "VALUE": "value",
+            "COMPUTED": Computed(lambda key: key.upper(), depends_on=["KEY"]),
+            "COMPUTED_COMPUTED": Computed(lambda computed: computed * 2, depends_on=["COMPUTED"]),
+        }
+        app_settings = ZeroSettings(key="APP", defaults=defaults)
+        self.assertEqual(app_settings.COMPUTED_COMPUTED, "KEYKEY")
+        app_settings._clear_cache("VALUE")
+        self.assertIn("COMPUTED", app_settings.__dict__)
+        self.assertIn("COMPUTED_COMPUTED", app_settings.__dict__)
+        with self.settings(APP={"KEY": "new_key"}):
+            app_settings._clear_cache("_cached_settings")
+            app_settings._clear_cache("KEY")
+            self.assertNotIn("COMPUTED", app_settings.__dict__)
+            self.assertNotIn("COMPUTED_COMPUTED", app_settings.__dict__)
+            self.assertEqual(app_settings.COMPUTED_COMPUTED, "NEW_KEYNEW_KEY")
+
+    @tag("args", "computed")
+    def test_computed_circular(self):
+        """
+        Test computed settings with circular dependencies
+        """
+        defaults = {
+            "A": Computed(lambda b: b, depends_on=["B"]),
+            "B": Computed(lambda a: a, depends_on=["A"]),
+        }
+        with self.assertRaisesMessage(ValueError, "has circular dependencies"):
+            ZeroSettings(key="APP", defaults=defaults)
+
+    @tag("attrs", "computed", "tenants")
+    def test_computed_tenant(self):
+        """
+        Test computed settings depending on tenant overrides are computed on tenant view
+        """
+        defaults = {
+            "KEY": "key",
+            "COMPUTED": Computed(lambda key: key.upper(), depends_on=["KEY"]),
+        }
+        app_settings = ZeroSettings(key="APP", defaults=defaults)
+        tenant_settings = app_settings.for_tenant("tenant", {"KEY": "tenant_key"})
+        self.assertEqual(tenant_settings.COMPUTED, "TENANT_KEY")
+        self.assertEqual(app_settings.COMPUTED, "KEY")
+
+    @tag("attrs", "instantiate_strings", "import_strings")
+    def test_instantiate_strings(self):
+        """
+        Test instantiate strings settings are instantiated once with kwargs
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"BACKEND": "utils.TestBackend", "BACKENDS": ["utils.TestBackend", "utils.TestBackend"]},
+            import_strings=["BACKEND", "BACKENDS"],
+            instantiate_strings={"BACKEND": {"timeout": 10}, "BACKENDS": None},
+        )
+        backend = app_settings.instance("BACKEND")
+        self.assertIsInstance(backend, app_settings.BACKEND)
+        self.assertEqual(backend.kwargs, {"timeout": 10})
+        self.assertIs(app_settings.instance("BACKEND"), backend)
+        self.assertEqual(len(app_settings.instance("BACKENDS")), 2)
+        with self.assertRaisesMessage(AttributeError, "Invalid instance setting: 'APP.NO_KEY'"):
+            app_settings.instance("NO_KEY")
+
+    @tag("attrs", "instantiate_strings", "cache")
+    def test_instantiate_strings_clear_cache(self):
+        """
+        Test instances are closed and created again after clear cache
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"BACKEND": "utils.TestBackend"},
+            import_strings=["BACKEND"],
+            instantiate_strings={"BACKEND": None},
+        )
+        backend = app_settings.instance("BACKEND")
+        app_settings._clear_cache("BACKEND")
+        self.assertTrue(backend.closed)
+        new_backend = app_settings.instance("BACKEND")
+        self.assertIsNot(new_backend, backend)
+        app_settings._clear_cache()
+        self.assertTrue(new_backend.closed)
+        self.assertIsNot(app_settings.instance("BACKEND"), new_backend)
+
+    @tag("attrs", "instantiate_strings", "cache_ttl", "cache")
+    def test_instantiate_strings_cache_ttl(self):
+        """
+        Test instances are closed and created again after their setting expires
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"BACKEND": "utils.TestBackend"},
+            import_strings=["BACKEND"],
+            instantiate_strings={"BACKEND": None},
+            cache_ttl=10,
+        )
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=100):
+            backend = app_settings.instance("BACKEND")
+            self.assertIs(app_settings.instance("BACKEND"), backend)
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=110):
+            new_backend = app_settings.instance("BACKEND")
+        self.assertTrue(backend.closed)
+        self.assertIsNot(new_backend, backend)
+
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=120):
+            app_settings.BACKEND
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=130):
+            self.assertIsNot(app_settings.instance("BACKEND"), new_backend)
+        self.assertTrue(new_backend.closed)
+
+    @tag("attrs", "instantiate_strings", "use_cache")
+    def test_instantiate_strings_no_cache(self):
+        """
+        Test instances are created on each call without cache
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"BACKEND": "utils.TestBackend"},
+            import_strings=["BACKEND"],
+            instantiate_strings={"BACKEND": None},
+            use_cache=False,
+        )
+        self.assertIsNot(app_settings.instance("BACKEND"), app_settings.instance("BACKEND"))
+
+    @tag("attrs", "instantiate_strings", "tenants", "max_tenants")
+    def test_instantiate_strings_tenants(self):
+        """
+        Test instances of evicted and replaced tenant views are closed
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"BACKEND": "utils.TestBackend", "KEY": "key"},
+            import_strings=["BACKEND"],
+            instantiate_strings={"BACKEND": None},
+            max_tenants=1,
+        )
+        overrides = {"BACKEND": "utils.TestBackend"}
+        replaced = app_settings.for_tenant("tenant_1", overrides).instance("BACKEND")
+        evicted = app_settings.for_tenant("tenant_1", dict(overrides, KEY="tenant_key")).instance("BACKEND")
+        self.assertTrue(replaced.closed)
+        self.assertFalse(evicted.closed)
+        app_settings.for_tenant("tenant_2", overrides)
+        self.assertTrue(evicted.closed)
+
+    @tag("attrs", "pickle", "lazy", "import_strings")
+    def test_pickle(self):
+        """
+        Test pickled settings only include args and are lazy
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            import_strings=self.IMPORT_STRINGS,
+            user_settings={"VALUE": "new_value"},
+        )
+        app_settings.IMPORT
+        app_settings.VALUE
+        data = pickle.dumps(app_settings)
+        self.assertNotIn(b"_cached", data)
+        unpickled_settings = pickle.loads(data)
+        self.assertFalse(unpickled_settings._is_setup)
+        self.assertEqual(unpickled_settings._cached_attrs, set())
+        self.assertEqual(unpickled_settings.VALUE, "new_value")
+        self.assertIs(unpickled_settings.IMPORT, app_settings.IMPORT)
+        self.assertTrue(unpickled_settings._is_setup)
+
+    @tag("attrs", "pickle", "lazy")
+    def test_private_attrs(self):
+        """
+        Test private and dunder attrs are not looked up as settings
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"_PRIVATE": "private"},
+            lazy=True,
+        )
+        with self.assertRaisesMessage(AttributeError, "'ZeroSettings' object has no attribute '__not_exists__'"):
+            app_settings.__not_exists__
+        with self.assertRaisesMessage(AttributeError, "'ZeroSettings' object has no attribute '_not_exists'"):
+            app_settings._not_exists
+        self.assertFalse(app_settings._is_setup)
+        self.assertEqual(app_settings._PRIVATE, "private")
+
+    @tag("attrs", "merge_strategies", "user_settings")
+    def test_merge_strategies(self):
+        """
+        Test user values are merged with defaults based on merge strategies
+        """
+        defaults = {
+            "DICT": {"KEY": "key", "VALUE": "value", "NESTED": {"KEY": "key", "VALUE": "value"}},
+            "LIST": ["list_1"],
+            "REPLACED": {"KEY": "key", "VALUE": "value"},
+            "NOT_SET": {"KEY": "key"},
+        }
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=defaults,
+            user_settings={
+                "DICT": {"VALUE": "new_value", "NESTED": {"VALUE": "new_value"}, "NEW": "new"},
+                "LIST": ["list_2"],
+                "REPLACED": {"VALUE": "new_value"},
+            },
+            merge_strategies={"DICT": "merge", "LIST": "append", "REPLACED": "replace", "NOT_SET": "merge"},
+        )
+        self.assertEqual(
+            app_settings.DICT,
+            {"KEY": "key", "VALUE": "new_value", "NESTED": {"KEY": "key", "VALUE": "new_value"}, "NEW": "new"},
+        )
+        self.assertEqual(app_settings.LIST, ["list_1", "list_2"])
+        self.assertEqual(app_settings.REPLACED, {"VALUE": "new_value"})
+        self.assertIs(app_settings.NOT_SET, defaults["NOT_SET"])
+        self.assertEqual(defaults["DICT"], {"KEY": "key", "VALUE": "value", "NESTED": {"KEY": "key", "VALUE": "value"}})
+        self.assertIs(app_settings.DICT, app_settings.DICT)
+
+    @tag("attrs", "merge_strategies", "import_strings", "tenants")
+    def test_merge_strategies_import_strings_and_tenants(self):
+        """
+        Test appended import strings and merged tenant overrides
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"IMPORT_LIST": ["utils.test_method_1"], "DICT": {"KEY": "key"}},
+            user_settings={"IMPORT_LIST": ["utils.test_method_2"]},
+            import_strings=["IMPORT_LIST"],
+            merge_strategies={"IMPORT_LIST": "append", "DICT": "merge"},
+        )
+        self.assertEqual([method() for method in app_settings.IMPORT_LIST], ["test_method_1", "test_method_2"])
+        tenant_settings = app_settings.for_tenant("tenant", {"DICT": {"VALUE": "value"}})
+        self.assertEqual(tenant_settings.DICT, {"KEY": "key", "VALUE": "value"})
+
+    @tag("attrs", "slow_access_hook", "import_strings")
+    def test_slow_access_hook(self):
+        """
+        Test slow access hook is called with slow accesses
+        """
+        slow_accesses = []
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            import_strings=self.IMPORT_STRINGS,
+            pre_check_imports=False,
+            slow_access_hook=slow_accesses.append,
+            slow_access_threshold=1e-9,
+        )
+        app_settings.KEY
+        app_settings.IMPORT
+        app_settings.IMPORT
+        self.assertEqual([slow_access.key for slow_access in slow_accesses], ["KEY", "IMPORT"])
+        self.assertEqual([slow_access.cache_state for slow_access in slow_accesses], ["cold", "warm"])
+        self.assertEqual([slow_access.imported for slow_access in slow_accesses], [False, True])
+        self.assertGreater(slow_accesses[0].elapsed, 0)
+
+    @tag("attrs", "slow_access_hook", "lazy", "import_strings")
+    def test_slow_access_hook_lazy(self):
+        """
+        Test lazy setup and pre checks of first access are reported to slow access hook
+        """
+        slow_accesses = []
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            import_strings=self.IMPORT_STRINGS,
+            lazy=True,
+            slow_access_hook=slow_accesses.append,
+            slow_access_threshold=1e-9,
+        )
+        with mock.patch.object(ZeroSettings, "_pre_check", wraps=app_settings._pre_check) as pre_check:
+            with mock.patch("zero_settings.settings.time.perf_counter", side_effect=[0, 10]):
+                app_settings.KEY
+        pre_check.assert_called_once_with()
+        self.assertEqual(len(slow_accesses), 1)
+        self.assertEqual(slow_accesses[0].key, "KEY")
+        self.assertEqual(slow_accesses[0].elapsed, 10)
+        self.assertEqual(slow_accesses[0].cache_state, "cold")
+        self.assertTrue(slow_accesses[0].imported)
+
+    @tag("attrs", "slow_access_hook")
+    def test_slow_access_hook_threshold_and_logger(self):
+        """
+        Test slow access hook with logger and accesses under threshold
+        """
+        logger = logging.getLogger("tests.settings")
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            use_cache=False,
+            slow_access_hook=logger,
+            slow_access_threshold=1e-9,
+        )
+        with self.assertLogs(logger, "WARNING") as logs:
+            app_settings.KEY
+        self.assertIn("Slow access to setting 'APP.KEY' took", logs.output[0])
+        self.assertIn("(cache: disabled, imported: False)", logs.output[0])
+
+        slow_accesses = []
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            slow_access_hook=slow_accesses.append,
+            slow_access_threshold=60,
+        )
+        app_settings.KEY
+        self.assertEqual(slow_accesses, [])
+
+    @tag("attrs", "secrets", "cache")
+    def test_secrets(self):
+        """
+        Test secrets are decrypted on first access and cached
+        """
+        decrypted = []
+
+        def decryptor(ciphertext):
+            decrypted.append(ciphertext)
+            return ciphertext[::-1]
+
+        secret = Secret("terces")
+        app_settings = ZeroSettings(key="APP", defaults={"SECRET": secret}, secret_decryptor=decryptor)
+        self.assertEqual(decrypted, [])
+        self.assertEqual(app_settings.SECRET, "secret")
+        self.assertEqual(app_settings.SECRET, "secret")
+        self.assertEqual(decrypted, ["terces"])
+        self.assertNotIn("terces", repr(secret))
+        app_settings._clear_cache()
+        self.assertEqual(app_settings.SECRET, "secret")
+        self.assertEqual(len(decrypted), 2)
+
+    @tag("attrs", "secrets", "cache")
+    def test_secrets_ttl(self):
+        """
+        Test secrets with ttl are decrypted again after ttl is expired
+        """
+        decrypted = []
+
+        def decryptor(ciphertext):
+            decrypted.append(ciphertext)
+            return ciphertext[::-1]
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"SECRET": Secret("terces", ttl=10)},
+            secret_decryptor=decryptor,
+        )
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=100):
+            self.assertEqual(app_settings.SECRET, "secret")
+            self.assertNotIn("SECRET", app_settings.__dict__)
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=109):
+            self.assertEqual(app_settings.SECRET, "secret")
+            self.assertEqual(len(decrypted), 1)
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=110):
+            self.assertEqual(app_settings.SECRET, "secret")
+            self.assertEqual(len(decrypted), 2)
+
+    @tag("attrs", "secrets")
+    def test_secrets_no_decryptor(self):
+        """
+        Test get a secret without secret decryptor
+        """
+        app_settings = ZeroSettings(key="APP", defaults={"SECRET": Secret("terces")})
+        with self.assertRaisesMessage(ValueError, "secret_decryptor is required to decrypt setting 'APP.SECRET'"):
+            app_settings.SECRET
+
+    @tag("attrs", "secrets")
+    @skipUnless(Fernet, "cryptography is not installed")
+    def test_secrets_keyfile_decryptor(self):
+        """
+        Test decrypt secrets with a key file
+        """
+        key = Fernet.generate_key()
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(key + b"\n")
+        self.addCleanup(os.remove, f.name)
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"SECRET": Secret(Fernet(key).encrypt(b"secret").decode())},
+            secret_decryptor=KeyfileDecryptor(f.name),
+        )
+        self.assertEqual(app_settings.SECRET, "secret")
+
+        data = pickle.dumps(app_settings)
+        raw_key = base64.urlsafe_b64decode(key)
+        for key_bytes in (key, raw_key[:16], raw_key[16:]):
+            self.assertNotIn(key_bytes, data)
+        self.assertEqual(pickle.loads(data).SECRET, "secret")
+
+    @tag("attrs", "generation", "cache", "override")
+    def test_generation(self):
+        """
+        Test generation increases on clear cache and override
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS)
+        self.assertEqual(app_settings.generation, 0)
+        app_settings.VALUE
+        self.assertEqual(app_settings.generation, 0)
+        app_settings._clear_cache("VALUE")
+        self.assertEqual(app_settings.generation, 1)
+        app_settings._clear_cache()
+        self.assertEqual(app_settings.generation, 2)
+        with self.settings(APP={"VALUE": "new_value"}):
+            self.assertEqual(app_settings.generation, 3)
+        self.assertEqual(app_settings.generation, 4)
+        with self.settings(OTHER_APP={"VALUE": "new_value"}):
+            self.assertEqual(app_settings.generation, 4)
+
+        # the last stored generation is the largest one, whatever order threads run in
+        threads = [threading.Thread(target=app_settings._next_generation) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(app_settings.generation, 54)
+
+    @tag("attrs", "warm", "cache", "import_strings")
+    def test_warm(self):
+        """
+        Test warm resolves and caches all settings
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=dict(self.DEFAULTS, REMOVED=None),
+            user_settings={"NOT_DEFAULT": "not_default"},
+            import_strings=self.IMPORT_STRINGS,
+            removed_settings={"REMOVED": None},
+            strict_defaults=False,
+            pre_check_removed=False,
+            lazy=True,
+        )
+        with mock.patch("zero_settings.settings.gc") as gc:
+            app_settings.warm()
+        gc.freeze.assert_called_once_with()
+        self.assertTrue(app_settings._is_setup)
+        self.assertEqual(app_settings._cached_attrs, set(self.DEFAULTS) | {"NOT_DEFAULT"})
+        self.assertEqual(app_settings.__dict__["IMPORT_LIST"][0](), "test_method_1")
+
+        with mock.patch("zero_settings.settings.gc") as gc:
+            app_settings.warm(freeze=False)
+        gc.freeze.assert_not_called()
+
+    @tag("attrs", "get", "cache", "strict_defaults")
+    def test_get(self):
+        """
+        Test get settings with default for invalid settings
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=dict(self.DEFAULTS, REMOVED=None),
+            import_strings=self.IMPORT_STRINGS,
+            removed_settings={"REMOVED": None},
+            pre_check_removed=False,
+        )
+        self.assertEqual(app_settings.get("KEY"), self.DEFAULTS["KEY"])
+        self.assertEqual(app_settings.get("KEY"), self.DEFAULTS["KEY"])
+        self.assertEqual(app_settings.get("IMPORT").test_method_0(), "test_method_0")
+        self.assertIsNone(app_settings.get("NO_KEY"))
+        self.assertEqual(app_settings.get("NO_KEY", "default"), "default")
+        self.assertEqual(app_settings.get("_key", "default"), "default")
+        self.assertIn("NO_KEY", app_settings._missing)
+        with self.assertRaisesMessage(RuntimeError, "The 'APP.REMOVED' setting has been removed."):
+            app_settings.get("REMOVED")
+
+    @tag("attrs", "get", "cache")
+    def test_negative_cache(self):
+        """
+        Test invalid settings are cached until cache is cleared
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS, strict_defaults=False)
+        self.assertFalse(hasattr(app_settings, "NOT_DEFAULT"))
+        self.assertIn("NOT_DEFAULT", app_settings._missing)
+        with mock.patch.object(app_settings, "_lookup") as lookup:
+            with self.assertRaisesMessage(AttributeError, "Invalid setting: 'APP.NOT_DEFAULT'"):
+                app_settings.NOT_DEFAULT
+            self.assertEqual(app_settings.get("NOT_DEFAULT", "default"), "default")
+        lookup.assert_not_called()
+        with self.settings(APP={"NOT_DEFAULT": "not_default"}):
+            app_settings._clear_cache()
+            self.assertNotIn("NOT_DEFAULT", app_settings._missing)
+            self.assertEqual(app_settings.get("NOT_DEFAULT"), "not_default")
+            self.assertEqual(app_settings.NOT_DEFAULT, "not_default")
+
+    @tag("attrs", "get", "use_cache")
+    def test_negative_cache_no_cache(self):
+        """
+        Test invalid settings are not cached without cache
+        """
+        app_settings = ZeroSettings(key="APP", defaults=self.DEFAULTS, strict_defaults=False, use_cache=False)
+        self.assertIsNone(app_settings.get("NOT_DEFAULT"))
+        self.assertEqual(app_settings._missing, set())
+        with self.settings(APP={"NOT_DEFAULT": "not_default"}):
+            self.assertEqual(app_settings.get("NOT_DEFAULT"), "not_default")
+
+    @tag("attrs", "freeze_values", "import_strings")
+    def test_freeze_values(self):
+        """
+        Test values are read only with freeze values
+        """
+        for use_cache in (True, False):
+            app_settings = ZeroSettings(
+                key="APP",
+                defaults=dict(self.DEFAULTS, NESTED={"LIST": [1, {"KEY": [2]}], "SET": {3}}),
+                import_strings=self.IMPORT_STRINGS,
+                use_cache=use_cache,
+                freeze_values=True,
+            )
+            self.assertEqual(app_settings.LIST, ("list_1", "list_2"))
+            self.assertEqual(app_settings.TUPLE, self.DEFAULTS["TUPLE"])
+            self.assertEqual(app_settings.DICT, self.DEFAULTS["DICT"])
+            self.assertEqual(app_settings.IMPORT_LIST[1](), "test_method_2")
+            nested = app_settings.NESTED
+            self.assertEqual(nested["LIST"][1]["KEY"], (2,))
+            self.assertEqual(nested["SET"], frozenset({3}))
+            with self.assertRaises(AttributeError):
+                app_settings.LIST.append("list_3")
+            with self.assertRaises(TypeError):
+                app_settings.DICT["1"] = 2
+            with self.assertRaises(TypeError):
+                nested["LIST"][1]["KEY"] = None
+            with self.assertRaises(AttributeError):
+                nested["SET"].add(4)
+            self.assertEqual(self.DEFAULTS["LIST"], ["list_1", "list_2"])
+
+    @tag("attrs", "static_import_check", "import_strings", "pre_check_imports")
+    def test_static_import_check(self):
+        """
+        Test pre check import strings statically without executing modules
+        """
+        sys.modules.pop("static_module", None)
+        names = ["StaticClass", "static_method", "path", "dumps", "CONSTANT", "OTHER_CONSTANT", "REST", "LOOP_NAME"]
+        names += ["LOOP_REST", "OPENED_FILE", "not_exists", "IMPORT_ERROR"]
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"IMPORT": "static_module.StaticClass", "IMPORT_LIST": ["static_module.%s" % name for name in names]},
+            import_strings=self.IMPORT_STRINGS,
+            static_import_check=True,
+        )
+        self.assertNotIn("static_module", sys.modules)
+        self.assertEqual(app_settings.IMPORT.__name__, "StaticClass")
+        self.assertIn("static_module", sys.modules)
+
+    @tag("static_import_check")
+    def test_static_import_check_names(self):
+        """
+        Test names of statements which are only parsed by newer pythons,
+        and of modules which define names dynamically
+        """
+        for source, expected in (
+            ("if (WALRUS := 1):\n    pass", {"WALRUS"}),
+            ("match 1:\n    case VALUE:\n        pass", None),
+            ("type ALIAS = int", {"ALIAS"}),
+            ("globals().update({'NAME': 1})", None),
+            ("def define():\n    global NAME\n    NAME = 1\n\ndefine()", None),
+        ):
+            try:
+                tree = ast.parse(source)
+            except SyntaxError:
+                continue
+            names = set()
+            found = _statements_names(tree.body, names)
+            if expected is None:
+                self.assertFalse(found)
+            else:
+                self.assertTrue(found)
+                self.assertEqual(names, expected)
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"IMPORT": "dynamic_module.FIRST"},
+            import_strings=["IMPORT"],
+            static_import_check=True,
+        )
+        self.assertEqual(app_settings.IMPORT, "first")
+
+    @tag("attrs", "static_import_check", "import_strings", "pre_check_imports")
+    def test_static_import_check_not_exists(self):
+        """
+        Test pre check wrong import strings statically
+        """
+        for import_string, error in (
+            ("static_module.NotExists", 'Module "static_module" does not define a "NotExists" attribute/class'),
+            ("not_exists.NotExists", "No module named 'not_exists'"),
+            ("not_exists", "not_exists doesn't look like a module path"),
+            ("utils.NotExists", 'Module "utils" does not define a "NotExists" attribute/class'),
+        ):
+            sys.modules.pop("static_module", None)
+            with self.assertRaisesMessage(
+                ImportError,
+                "Could not import '%s' for setting 'APP.IMPORT'. %s." % (import_string, error),
+            ):
+                ZeroSettings(
+                    key="APP",
+                    defaults={"IMPORT": import_string},
+                    import_strings=["IMPORT"],
+                    static_import_check=True,
+                )
+            self.assertNotIn("static_module", sys.modules)
+
+    @tag("attrs", "cache_ttl", "cache_ttls", "cache")
+    def test_cache_ttls(self):
+        """
+        Test settings with ttl are resolved again after they expire
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults=self.DEFAULTS,
+            cache_ttl=10,
+            cache_ttls={"KEY": 20, "LIST": None},
+        )
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=100):
+            self.assertEqual(app_settings.KEY, self.DEFAULTS["KEY"])
+            self.assertEqual(app_settings.VALUE, self.DEFAULTS["VALUE"])
+            self.assertEqual(app_settings.LIST, self.DEFAULTS["LIST"])
+        self.assertIn("LIST", app_settings.__dict__)
+        self.assertNotIn("KEY", app_settings.__dict__)
+        self.assertNotIn("VALUE", app_settings.__dict__)
+
+        with self.settings(APP={"KEY": "new_key", "VALUE": "new_value", "LIST": []}):
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=109):
+                self.assertEqual(app_settings.KEY, self.DEFAULTS["KEY"])
+                self.assertEqual(app_settings.VALUE, self.DEFAULTS["VALUE"])
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=110):
+                self.assertEqual(app_settings.KEY, self.DEFAULTS["KEY"])
+                self.assertEqual(app_settings.VALUE, "new_value")
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=120):
+                self.assertEqual(app_settings.KEY, "new_key")
+            self.assertEqual(app_settings.LIST, self.DEFAULTS["LIST"])
+
+    @tag("attrs", "cache_ttl", "computed", "cache")
+    def test_cache_ttls_computed(self):
+        """
+        Test computed settings are resolved again after their dependencies expire
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"KEY": "key", "COMPUTED": Computed(lambda key: key.upper(), depends_on=["KEY"])},
+            cache_ttls={"KEY": 10},
+        )
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=100):
+            self.assertEqual(app_settings.COMPUTED, "KEY")
+        with self.settings(APP={"KEY": "new_key"}):
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=110):
+                self.assertEqual(app_settings.KEY, "new_key")
+                self.assertEqual(app_settings.COMPUTED, "NEW_KEY")
+
+    @tag("attrs", "factory", "pre_check_defaults")
+    def test_factory(self):
+        """
+        Test factory settings are only built on first access and cached
+        """
+        factory = mock.Mock(return_value={"KEY": "value"})
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"TABLE": Factory(factory), "KEY": "key"},
+            pre_check_defaults=True,
+            pre_check_imports=True,
+            pre_check_removed=True,
+        )
+        factory.assert_not_called()
+        self.assertEqual(app_settings.KEY, "key")
+        factory.assert_not_called()
+
+        self.assertEqual(app_settings.TABLE, {"KEY": "value"})
+        self.assertIs(app_settings.TABLE, app_settings.TABLE)
+        factory.assert_called_once_with()
+
+        with self.assertRaisesMessage(ValueError, "func must be callable"):
+            Factory("string")
+
+    @tag("attrs", "factory", "user_settings")
+    def test_factory_user_settings(self):
+        """
+        Test factory settings are not built when users override them
+        """
+        factory = mock.Mock(return_value="default")
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"TABLE": Factory(factory)},
+            user_settings={"TABLE": "user"},
+        )
+        self.assertEqual(app_settings.TABLE, "user")
+        factory.assert_not_called()
+
+    @tag("attrs", "handle", "cache")
+    def test_handle(self):
+        """
+        Test handles are updated in place when their settings are removed from cache
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"KEY": "key", "UPPER": Computed(lambda key: key.upper(), depends_on=["KEY"])},
+        )
+        handle = app_settings.handle("KEY")
+        upper = app_settings.handle("UPPER")
+        self.assertIs(app_settings.handle("KEY"), handle)
+        self.assertEqual(handle.key, "KEY")
+        self.assertEqual(handle.value, "key")
+        self.assertEqual(upper.value, "KEY")
+
+        with self.settings(APP={"KEY": "new_key"}):
+            self.assertEqual(handle.value, "key")
+            app_settings._clear_cache()
+            self.assertEqual(handle.value, "new_key")
+            self.assertEqual(upper.value, "NEW_KEY")
+        app_settings._clear_cache()
+        self.assertEqual(handle.value, "key")
+        self.assertEqual(upper.value, "KEY")
+
+        with self.assertRaises(AttributeError):
+            handle.other = "other"
+        with self.assertRaisesMessage(AttributeError, "Invalid setting: 'APP.INVALID'"):
+            app_settings.handle("INVALID")
+
+        del handle
+        self.assertNotIn("KEY", app_settings._handles)
+
+    @tag("attrs", "handle", "cache_ttl", "cache")
+    def test_handle_cache_ttl(self):
+        """
+        Test handles of settings with ttl, or depending on them, follow expiry
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"KEY": "key", "VALUE": "value", "UPPER": Computed(lambda key: key.upper(), depends_on=["KEY"])},
+            cache_ttls={"KEY": 10},
+        )
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=100):
+            handle = app_settings.handle("KEY")
+            upper = app_settings.handle("UPPER")
+            value = app_settings.handle("VALUE")
+        with self.settings(APP={"KEY": "new_key", "VALUE": "new_value"}):
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=109):
+                self.assertEqual(handle.value, "key")
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=110):
+                self.assertEqual(handle.value, "new_key")
+                self.assertEqual(upper.value, "NEW_KEY")
+            self.assertEqual(value.value, "value")
+
+        app_settings = ZeroSettings(key="APP", defaults={"KEY": "key"}, use_cache=False)
+        handle = app_settings.handle("KEY")
+        with self.settings(APP={"KEY": "new_key"}):
+            self.assertEqual(handle.value, "new_key")
+
+    @tag("attrs", "handle", "cache")
+    def test_handle_invalidated_while_marked_fresh(self):
+        """
+        Test handles stay stale if they are invalidated before they are marked fresh
+        """
+        settings = mock.Mock(KEY="new_key")
+        type(settings).generation = mock.PropertyMock(side_effect=[1, 1, 2])
+        handle = SettingHandle("KEY", "key", settings)
+        handle._mark_stale()
+        # generation is increased after it is checked and before handle is marked fresh
+        self.assertEqual(handle.value, "new_key")
+        self.assertIsNot(type(handle), SettingHandle)
+        type(settings).generation = mock.PropertyMock(return_value=2)
+        self.assertEqual(handle.value, "new_key")
+        self.assertIs(type(handle), SettingHandle)
+
+    @tag("attrs", "handle", "cache", "import_strings")
+    def test_handle_invalid(self):
+        """
+        Test clear cache does not raise for handles of settings which are not valid anymore
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"IMPORT": "utils.test_method_1"},
+            import_strings=["IMPORT"],
+            strict_defaults=False,
+        )
+        subscriber = mock.Mock()
+        app_settings.subscribe(["IMPORT"], subscriber)
+        with self.settings(APP={"EXTRA": "extra"}):
+            app_settings._clear_cache()
+            extra = app_settings.handle("EXTRA")
+        handle = app_settings.handle("IMPORT")
+        self.assertEqual(handle.value(), "test_method_1")
+
+        generation = app_settings.generation
+        with self.settings(APP={"IMPORT": "utils.nope"}):
+            app_settings._clear_cache()
+            app_settings._clear_cache()
+            self.assertGreater(app_settings.generation, generation)
+            subscriber.assert_called_once_with({"IMPORT"})
+            with self.assertRaisesMessage(ImportError, "Could not import 'utils.nope' for setting 'APP.IMPORT'"):
+                handle.value
+            with self.assertRaisesMessage(AttributeError, "Invalid setting: 'APP.EXTRA'"):
+                extra.value
+
+        app_settings._clear_cache()
+        self.assertEqual(handle.value(), "test_method_1")
+        self.assertIs(type(handle), SettingHandle)
+
+    @tag("attrs", "namespace", "cache")
+    def test_namespace(self):
+        """
+        Test namespace views project settings with prefix and are updated on clear cache
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"CACHE_HOST": "localhost", "CACHE_PORT": 6379, "CACHE_OLD": None, "KEY": "key"},
+            removed_settings={"CACHE_OLD": None},
+            pre_check_removed=False,
+        )
+        cache_settings = app_settings.namespace("CACHE_")
+        self.assertIs(app_settings.namespace("CACHE_"), cache_settings)
+        self.assertEqual(dict(cache_settings), {"HOST": "localhost", "PORT": 6379})
+        self.assertEqual(cache_settings.HOST, "localhost")
+        self.assertEqual(cache_settings["PORT"], 6379)
+        self.assertEqual(len(cache_settings), 2)
+        self.assertNotIn("KEY", cache_settings)
+        with self.assertRaisesMessage(AttributeError, "Invalid setting: 'APP.CACHE_KEY'"):
+            cache_settings.KEY
+
+        projection = cache_settings._projection
+        app_settings._clear_cache("KEY")
+        self.assertIs(cache_settings._projection, projection)
+
+        with self.settings(APP={"CACHE_HOST": "cache"}):
+            self.assertEqual(cache_settings.HOST, "localhost")
+            app_settings._clear_cache()
+            self.assertEqual(cache_settings.HOST, "cache")
+            app_settings._clear_cache("CACHE_PORT")
+            self.assertIsNone(cache_settings._projection)
+
+        for prefix in ("", None, 1):
+            with self.assertRaisesMessage(ValueError, "prefix must be non empty string"):
+                app_settings.namespace(prefix)
+
+    @tag("attrs", "namespace", "cache_ttl", "cache")
+    def test_namespace_cache_ttl(self):
+        """
+        Test namespace views with settings with ttl follow expiry
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"CACHE_HOST": "h1", "CACHE_PORT": 6379},
+            cache_ttls={"CACHE_HOST": 10},
+        )
+        cache_settings = app_settings.namespace("CACHE_")
+        with mock.patch("zero_settings.settings.time.monotonic", return_value=100):
+            self.assertEqual(cache_settings.HOST, "h1")
+        with self.settings(APP={"CACHE_HOST": "h2", "CACHE_PORT": 6380}):
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=109):
+                self.assertEqual(cache_settings.HOST, "h1")
+            with mock.patch("zero_settings.settings.time.monotonic", return_value=110):
+                self.assertEqual(cache_settings.HOST, "h2")
+                self.assertEqual(cache_settings.PORT, 6379)
+        self.assertIsNone(cache_settings._projection)
+
+    @tag("attrs", "user_settings", "sources")
+    def test_json_lines_source(self):
+        """
+        Test settings from a JSON lines source are decoded on first access and cached
+        """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "flags.jsonl")
+        with open(path, "w") as f:
+            f.write('{"FLAG_1": true}\n\n{"FLAG_2": [1, 2], "FLAG_3": {"KEY": "value"}}\n{"FLAG_1": false}')
+
+        source = JsonLinesSource(path)
+        self.addCleanup(source.close)
+        self.assertTrue(os.path.exists(path + ".index"))
+        self.assertEqual(sorted(source), ["FLAG_1", "FLAG_2", "FLAG_3"])
+        self.assertEqual(dict(source), {"FLAG_1": False, "FLAG_2": [1, 2], "FLAG_3": {"KEY": "value"}})
+        self.assertNotIn("FLAG_4", source)
+
+        with mock.patch.object(JsonLinesSource, "_build_index") as build_index:
+            loaded = JsonLinesSource(path)
+            self.addCleanup(loaded.close)
+        build_index.assert_not_called()
+        self.assertEqual(loaded._index, source._index)
+
+        with self.settings(APP={"FLAG_3": "django", "FLAG_4": "django"}):
+            app_settings = ZeroSettings(
+                key="APP",
+                defaults={"FLAG_1": True, "FLAG_5": "default"},
+                user_settings=pickle.loads(pickle.dumps(source)),
+                strict_defaults=False,
+            )
+            with mock.patch.object(JsonLinesSource, "_decode", wraps=app_settings._user_settings._decode) as decode:
+                self.assertEqual(app_settings.FLAG_1, False)
+                self.assertEqual(app_settings.FLAG_1, False)
+                self.assertEqual(app_settings.FLAG_3, {"KEY": "value"})
+                self.assertEqual(app_settings.FLAG_4, "django")
+                self.assertEqual(app_settings.FLAG_5, "default")
+            self.assertEqual(decode.call_count, 2)
+            self.assertEqual(sorted(app_settings._get_keys()), ["FLAG_1", "FLAG_2", "FLAG_3", "FLAG_4", "FLAG_5"])
+
+        with open(path, "a") as f:
+            f.write("\n[]\n")
+        with self.assertRaisesMessage(ValueError, "Invalid JSON at line 5 of '%s'. line must be an object." % path):
+            JsonLinesSource(path)
+
+    @tag("attrs", "subscribe", "cache", "override")
+    def test_subscribe(self):
+        """
+        Test subscribers are called once with changed keys on overrides and clear cache
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={
+                "HOST": "localhost",
+                "PORT": 8000,
+                "TOKEN": "token",
+                "DEBUG": False,
+                "URL": Computed(lambda host, port: "%s:%s" % (host, port), depends_on=["HOST", "PORT"]),
+            },
+        )
+        pool = mock.Mock()
+        client = mock.Mock()
+        app_settings.subscribe(["URL"], pool)
+        app_settings.subscribe(("TOKEN", "PORT"), client)
+        self.assertEqual(app_settings.URL, "localhost:8000")
+        self.assertEqual(app_settings.TOKEN, "token")
+
+        app_settings._clear_cache()
+        pool.assert_not_called()
+        client.assert_not_called()
+        self.assertEqual(app_settings.URL, "localhost:8000")
+        self.assertEqual(app_settings.DEBUG, False)
+
+        urls = []
+        pool.side_effect = lambda changed: urls.append(app_settings.URL)
+        with self.settings(APP={"HOST": "host", "PORT": 8000, "DEBUG": True}):
+            pool.assert_called_once_with({"URL"})
+            client.assert_not_called()
+            self.assertEqual(urls, ["host:8000"])
+            self.assertEqual(app_settings.URL, "host:8000")
+            self.assertEqual(app_settings.TOKEN, "token")
+            # cached settings which are not subscribed keep their values
+            self.assertEqual(app_settings.DEBUG, False)
+            app_settings._clear_cache()
+            pool.assert_called_once_with({"URL"})
+            self.assertEqual(app_settings.DEBUG, True)
+        self.assertEqual(pool.call_count, 2)
+        self.assertEqual(urls, ["host:8000", "localhost:8000"])
+        self.assertEqual(app_settings.URL, "localhost:8000")
+
+        with override_settings(APP={"PORT": 8001, "TOKEN": "new_token"}):
+            self.assertEqual(pool.call_count, 3)
+            client.assert_called_once_with({"TOKEN", "PORT"})
+
+        app_settings.unsubscribe(client)
+        with override_settings(APP={"TOKEN": "new_token"}):
+            self.assertEqual(client.call_count, 2)
+
+        for keys in ("KEY", None, [1]):
+            with self.assertRaisesMessage(ValueError, "keys must be list/tuple of strings"):
+                app_settings.subscribe(keys, pool)
+        with self.assertRaisesMessage(ValueError, "callback must be callable"):
+            app_settings.subscribe(["KEY"], "callback")
+
+    @tag("attrs", "aget", "cache")
+    def test_aget(self):
+        """
+        Test aget resolves settings off event loop and coalesces concurrent loads
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            return {"KEY": "value"}
+
+        factory = mock.Mock(side_effect=load)
+        app_settings = ZeroSettings(key="APP", defaults={"TABLE": Factory(factory), "KEY": "key"})
+
+        async def run():
+            loads = [asyncio.ensure_future(app_settings.aget("TABLE")) for _ in range(10)]
+            await asyncio.get_event_loop().run_in_executor(None, started.wait, 5)
+            # event loop is not blocked while table is loading
+            self.assertEqual(await app_settings.aget_many(["KEY"]), {"KEY": "key"})
+            release.set()
+            return await asyncio.gather(*loads)
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        values = loop.run_until_complete(run())
+        self.assertEqual(values, [{"KEY": "value"}] * 10)
+        factory.assert_called_once_with()
+        self.assertEqual(app_settings._loads, {})
+        self.assertEqual(
+            loop.run_until_complete(app_settings.aget_many(["TABLE", "KEY"])),
+            {"TABLE": {"KEY": "value"}, "KEY": "key"},
+        )
+        with self.assertRaisesMessage(AttributeError, "Invalid setting: 'APP.INVALID'"):
+            loop.run_until_complete(app_settings.aget("INVALID"))
+
+    @tag("attrs", "conditional", "resolve")
+    def test_conditional(self):
+        """
+        Test conditional settings are compiled once and resolved for contexts
+        """
+        conditional = Conditional(
+            "old",
+            rules=[
+                {"attr": "plan", "in": ["pro", "team"], "value": "new"},
+                {"attr": "plan", "in": ["pro", "free"], "value": "other"},
+                {"attr": "id", "percent": 50, "value": "rollout"},
+            ],
+        )
+        app_settings = ZeroSettings(key="APP", defaults={"CHECKOUT": conditional, "KEY": "key"})
+        with mock.patch.object(Conditional, "compile", wraps=conditional.compile) as compile:
+            self.assertEqual(app_settings.resolve("CHECKOUT", {"plan": "pro"}), "new")
+            self.assertEqual(app_settings.resolve("CHECKOUT", mock.Mock(plan="free")), "other")
+            self.assertEqual(app_settings.resolve("CHECKOUT", {"plan": ["unhashable"]}), "old")
+            self.assertEqual(app_settings.resolve("CHECKOUT", {}), "old")
+        compile.assert_called_once_with("APP.CHECKOUT")
+        self.assertEqual(app_settings.resolve("KEY", {"plan": "pro"}), "key")
+
+        values = [app_settings.resolve("CHECKOUT", {"plan": "free_trial", "id": i}) for i in range(1000)]
+        self.assertEqual(set(values), {"old", "rollout"})
+        self.assertAlmostEqual(values.count("rollout") / 1000, 0.5, delta=0.1)
+        self.assertEqual(values, [app_settings.CHECKOUT({"plan": "free_trial", "id": i}) for i in range(1000)])
+
+        tenant_settings = app_settings.for_tenant("tenant", {"CHECKOUT": Conditional("tenant", rules=[])})
+        self.assertEqual(tenant_settings.resolve("CHECKOUT", {"plan": "pro"}), "tenant")
+
+        for rules, msg in (
+            ("rules", "rules must be list/tuple of dicts"),
+            (["rule"], "rules must be dicts with attr string and value"),
+            ([{"attr": "plan", "value": 1}], "rules must have one of in or percent"),
+            ([{"attr": "plan", "in": "pro", "value": 1}], "in of rules must be list/tuple/set"),
+            ([{"attr": "id", "percent": 101, "value": 1}], "percent of rules must be positive number up to 100"),
+        ):
+            with self.assertRaisesMessage(ValueError, msg):
+                Conditional("default", rules)
+
+    @tag("attrs", "reload", "cache")
+    def test_reload(self):
+        """
+        Test reload swaps in resolved settings, and keeps old settings on errors
+        """
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={
+                "KEY": "key",
+                "VALUE": "value",
+                "IMPORT": "utils.test_method_1",
+                "UPPER": Computed(lambda key: key.upper(), depends_on=["KEY"]),
+            },
+            import_strings=["IMPORT"],
+            instantiate_strings={"IMPORT": None},
+        )
+        subscriber = mock.Mock()
+        app_settings.subscribe(["UPPER", "IMPORT"], subscriber)
+        handle = app_settings.handle("UPPER")
+        namespace = app_settings.namespace("UP")
+        tenant_settings = app_settings.for_tenant("tenant", {"IMPORT": "utils.test_method_2"})
+        self.assertEqual(dict(namespace), {"PER": "KEY"})
+        self.assertEqual(tenant_settings.UPPER, "KEY")
+        self.assertEqual(app_settings.instance("IMPORT"), "test_method_1")
+        generation = app_settings.generation
+
+        with self.settings(APP={"KEY": "new_key"}):
+            old_dict = app_settings.__dict__
+            app_settings.reload()
+            self.assertIsNot(app_settings.__dict__, old_dict)
+            self.assertEqual(app_settings._cached_attrs, {"KEY", "VALUE", "IMPORT", "UPPER"})
+            self.assertEqual(app_settings.UPPER, "NEW_KEY")
+            self.assertEqual(handle.value, "NEW_KEY")
+            self.assertEqual(dict(namespace), {"PER": "NEW_KEY"})
+            self.assertEqual(tenant_settings.UPPER, "NEW_KEY")
+            self.assertIs(app_settings.for_tenant("tenant"), tenant_settings)
+            self.assertEqual(app_settings._instances, {})
+            subscriber.assert_called_with({"UPPER"})
+            self.assertGreater(app_settings.generation, generation)
+
+        with self.settings(APP={"VALUE": "other_value", "IMPORT": "utils.invalid"}):
+            old_dict = app_settings.__dict__
+            with self.assertRaisesMessage(ImportError, "Could not import 'utils.invalid' for setting 'APP.IMPORT'"):
+                app_settings.reload()
+            self.assertIs(app_settings.__dict__, old_dict)
+            self.assertEqual(app_settings.VALUE, "value")
+
+    @tag("attrs", "reload", "cache")
+    def test_reload_concurrent_resolve(self):
+        """
+        Test values resolved from old settings while reloading are not cached after it
+        """
+        started = threading.Event()
+        proceed = threading.Event()
+
+        def slow(key):
+            if not started.is_set():
+                started.set()
+                proceed.wait(5)
+            return key.upper()
+
+        user_settings = {"KEY": "key"}
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={"KEY": "key", "SLOW": Computed(slow, depends_on=["KEY"])},
+            user_settings=user_settings,
+        )
+        reader = threading.Thread(target=getattr, args=(app_settings, "SLOW"))
+        reader.start()
+        started.wait(5)
+
+        def close_instances(settings, instances, attr=None):
+            # old value is resolved between the swap and the rest of reload
+            proceed.set()
+            reader.join(5)
+
+        # user settings are changed without an override, which would increase generation
+        user_settings["KEY"] = "new_key"
+        with mock.patch.object(ZeroSettings, "_close_instances", autospec=True, side_effect=close_instances):
+            app_settings.reload()
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(app_settings.SLOW, "NEW_KEY")
+
+    @tag("attrs", "tenants", "copy")
+    def test_tenant_private_attrs(self):
+        """
+        Test private attrs of tenant views are not looked up as settings
+        """
+        app_settings = ZeroSettings(key="APP", defaults={"KEY": "key", "_PRIVATE": "private"})
+        tenant_settings = app_settings.for_tenant("tenant", {"KEY": "tenant_key"})
+        copied_settings = copy.copy(tenant_settings)
+        self.assertEqual(copied_settings.KEY, "tenant_key")
+        self.assertEqual(copied_settings._PRIVATE, "private")
+        with self.assertRaisesMessage(AttributeError, "'TenantSettings' object has no attribute '_missing'"):
+            tenant_settings._missing
@@ -0,0 +1,136 @@
+from unittest import skipUnless
+
+from django.test import TestCase, override_settings, tag
+from zero_settings import ZeroSettings, Computed, Factory
+
+try:
+    from hypothesis import given, settings, strategies as st
+except ImportError:
+    given = None
+
+KEYS = ("KEY", "LIST", "DICT", "IMPORT", "COMPUTED", "FACTORY", "REMOVED", "EXTRA")
+USER_KEYS = ("KEY", "LIST", "IMPORT", "REMOVED", "EXTRA")
+IMPORTS = ("utils.test_method_1", "utils.test_method_2", "utils.missing_method")
+
+
+def get_defaults():
+    """
+    Return defaults with all kinds of settings, created for each instance
+    """
+    return {
+        "KEY": "key",
+        "LIST": ["item"],
+        "DICT": {"KEY": "key"},
+        "IMPORT": "utils.test_method_1",
+        "COMPUTED": Computed(lambda key: key.upper(), depends_on=["KEY"]),
+        "FACTORY": Factory(lambda: {"KEY": "factory"}),
+    }
+
+
+def run_operation(app_settings, operation):
+    """
+    Run an operation on settings and return its result or raised error
+    """
+    name, arg = operation
+    try:
+        if name == "getattr":
+            return "ok", getattr(app_settings, arg)
+        elif name == "get":
+            return "ok", app_settings.get(arg, "default")
+        elif name == "clear":
+            app_settings._clear_cache(arg)
+            return "ok", None
+    except Exception as e:
+        return type(e), str(e)
+
+
+@tag("differential")
+class TestDifferential(TestCase):
+    @skipUnless(given, "hypothesis is not installed")
+    def test_cached_and_uncached(self):
+        """
+        Test cached and uncached settings return the same results for random operations
+        """
+        user_settings = st.dictionaries(
+            st.sampled_from(USER_KEYS),
+            st.one_of(st.text(max_size=5), st.lists(st.integers(), max_size=3), st.sampled_from(IMPORTS)),
+            min_size=1,
+            max_size=3,
+        ).map(lambda value: {key: item if key != "KEY" else str(item) for key, item in value.items()})
+        operations = st.lists(
+            st.one_of(
+                st.tuples(st.sampled_from(("getattr", "get")), st.sampled_from(KEYS)),
+                st.tuples(st.just("clear"), st.one_of(st.none(), st.sampled_from(KEYS))),
+                st.tuples(st.just("override"), st.one_of(st.none(), user_settings)),
+            ),
+            min_size=10,
+            max_size=40,
+        )
+        config = st.fixed_dictionaries(
+            {
+                "strict_defaults": st.booleans(),
+                "pre_check_defaults": st.booleans(),
+                "pre_check_imports": st.booleans(),
+                "pre_check_removed": st.booleans(),
+                "lazy": st.booleans(),
+                "freeze_values": st.booleans(),
+            }
+        )
+
+        @settings(max_examples=200, deadline=None)
+        @given(config, st.one_of(st.none(), user_settings), st.sampled_from((None, 3600)), operations)
+        def run(config, initial_settings, cache_ttl, operations):
+            try:
+                self.override(initial_settings)
+                self.run_operations(config, cache_ttl, operations)
+            finally:
+                self.override(None)
+
+        self.current_override = None
+        run()
+
+    def override(self, user_settings):
+        """
+        Override user settings, or remove the current override if user settings is None
+        """
+        if self.current_override is not None:
+            self.current_override.disable()
+            self.current_override = None
+        if user_settings is not None:
+            self.current_override = override_settings(APP=user_settings)
+            self.current_override.enable()
+
+    def run_operations(self, config, cache_ttl, operations):
+        """
+        Run operations on a cached and an uncached instance and compare results,
+        overrides are followed by a clear cache, as cached values are kept on overrides
+        """
+        instances = []
+        for use_cache in (True, False):
+            try:
+                instances.append(
+                    ZeroSettings(
+                        key="APP",
+                        defaults=get_defaults(),
+                        import_strings=["IMPORT"],
+                        removed_settings={"REMOVED": None},
+                        use_cache=use_cache,
+                        cache_ttl=cache_ttl if use_cache else None,
+                        **config
+                    )
+                )
+            except Exception as e:
+                instances.append((type(e), str(e)))
+
+        cached, uncached = instances
+        self.assertEqual(type(cached), type(uncached))
+        if not isinstance(cached, ZeroSettings):
+            self.assertEqual(cached, uncached)
+            return
+
+        for operation in operations:
+            name, arg = operation
+            if name == "override":
+                self.override(arg)
+                operation = ("clear", None)
+            self.assertEqual(run_operation(cached, operation), run_operation(uncached, operation), operation)
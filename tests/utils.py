@@ -9,4 +9,13 @@ def test_method_1():
 
 
 def test_method_2():
-    return "test_method_2"
\ No newline at end of file
+    return "test_method_2"
+
+
+class TestBackend:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self):
+        self.closed = True
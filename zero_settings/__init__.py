@@ -1,5 +1,11 @@
 from collections import namedtuple
-from .settings import ZeroSettings
+from .decryptors import KeyfileDecryptor
+from .handles import SettingHandle
+from .namespaces import NamespaceSettings
+from .settings import SlowAccess, ZeroSettings
+from .sources import JsonLinesSource
+from .tenants import TenantSettings
+from .values import Computed, Conditional, Factory, Secret
 
 
 VersionInfo = namedtuple("VersionInfo", ("major", "minor", "patch"))
@@ -7,4 +13,16 @@ VersionInfo = namedtuple("VersionInfo", ("major", "minor", "patch"))
 VERSION = VersionInfo(0, 1, 13)
 
 __version__ = "{0.major}.{0.minor}.{0.patch}".format(VERSION)
-__all__ = [ZeroSettings]
+__all__ = [
+    ZeroSettings,
+    TenantSettings,
+    NamespaceSettings,
+    Computed,
+    Conditional,
+    Factory,
+    Secret,
+    KeyfileDecryptor,
+    JsonLinesSource,
+    SlowAccess,
+    SettingHandle,
+]
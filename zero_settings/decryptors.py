@@ -0,0 +1,34 @@
+class KeyfileDecryptor:
+    """
+    Decrypt secrets with a Fernet key stored in a local file,
+    requires cryptography package.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fernet = None
+
+    def _get_fernet(self):
+        """
+        Load key file on first use and return Fernet object
+        """
+        if self._fernet is None:
+            try:
+                from cryptography.fernet import Fernet
+            except ImportError:
+                raise ImportError("KeyfileDecryptor requires cryptography, install it with 'pip install cryptography'.")
+            with open(self.path, "rb") as f:
+                self._fernet = Fernet(f.read().strip())
+        return self._fernet
+
+    def __reduce__(self):
+        # only path is pickled, so the loaded key is never sent with settings
+        return self.__class__, (self.path,)
+
+    def __call__(self, ciphertext):
+        """
+        Return decrypted string of ciphertext
+        """
+        if isinstance(ciphertext, str):
+            ciphertext = ciphertext.encode()
+        return self._get_fernet().decrypt(ciphertext).decode()
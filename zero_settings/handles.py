@@ -0,0 +1,69 @@
+class SettingHandle:
+    """
+    A bound accessor of one setting, which is marked stale by settings
+    object whenever the setting is removed from cache, and resolves its
+    value again on next read.
+
+        handle = app_settings.handle("TIMEOUT")
+
+        for item in items:
+            process(item, handle.value)
+
+    Reading value of a fresh handle is a slot read, without the instance
+    dict lookup of getting the setting from settings object. Handles of
+    settings with ttl or without cache resolve their value on each read.
+    """
+
+    __slots__ = ("key", "value", "settings", "__weakref__")
+
+    def __init__(self, key, value, settings):
+        self.key = key
+        self.value = value
+        self.settings = settings
+
+    def _mark_stale(self):
+        """
+        Resolve value again on next read, instead of reading the slot
+        """
+        self.__class__ = _StaleSettingHandle
+
+    def __repr__(self):
+        return "SettingHandle(%r)" % self.key
+
+
+class _StaleSettingHandle(SettingHandle):
+    """
+    A stale handle, which its value is resolved on read, errors are raised
+    like getting the setting from settings object
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        generation = self.settings.generation
+        value = getattr(self.settings, self.key)
+        # keep handle stale if it is invalidated again while resolving,
+        # or before it is marked fresh, which would overwrite being marked stale
+        if generation == self.settings.generation:
+            SettingHandle.value.__set__(self, value)
+            self.__class__ = SettingHandle
+            if generation != self.settings.generation:
+                self.__class__ = _StaleSettingHandle
+        return value
+
+
+class _LiveSettingHandle(SettingHandle):
+    """
+    A handle of a setting with ttl or without cache, which its value is
+    always resolved, as expiry is only found when the setting is accessed
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return getattr(self.settings, self.key)
+
+    def _mark_stale(self):
+        pass
@@ -0,0 +1,129 @@
+import ast
+import importlib.util
+import sys
+from functools import lru_cache
+
+# compound statements which their bodies are run at module level
+_BLOCKS = tuple(
+    getattr(ast, name)
+    for name in ("If", "For", "AsyncFor", "While", "With", "AsyncWith", "Try", "TryStar")
+    if hasattr(ast, name)
+)
+_ASSIGNS = tuple(getattr(ast, name) for name in ("AnnAssign", "AugAssign") if hasattr(ast, name))
+# statements which their bindings are not modeled, e.g. match patterns
+_UNKNOWN = tuple(getattr(ast, name) for name in ("Match",) if hasattr(ast, name))
+
+
+def _target_names(target):
+    """
+    Yield names assigned by an assignment target
+    """
+    if isinstance(target, ast.Name):
+        yield target.id
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        for item in target.elts:
+            yield from _target_names(item)
+    elif isinstance(target, ast.Starred):
+        yield from _target_names(target.value)
+
+
+def _statements_names(statements, names):
+    """
+    Add names defined by statements to names, return False if names can not
+    be found statically, e.g. star imports, match blocks, global statements,
+    globals() calls or a module __getattr__
+    """
+    for node in statements:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Global) or (
+                isinstance(child, ast.Call) and isinstance(child.func, ast.Name) and child.func.id == "globals"
+            ):
+                return False
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+            continue
+        if isinstance(node, _UNKNOWN):
+            return False
+
+        # assignment expressions bind names of the enclosing scope anywhere in a statement
+        for child in ast.walk(node):
+            if type(child).__name__ == "NamedExpr":
+                names.update(_target_names(child.target))
+
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                names.update(_target_names(target))
+        elif isinstance(node, _ASSIGNS):
+            names.update(_target_names(node.target))
+        elif type(node).__name__ == "TypeAlias":
+            names.update(_target_names(node.name))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    return False
+                names.add(alias.asname or alias.name.split(".")[0])
+        elif isinstance(node, _BLOCKS):
+            if hasattr(node, "target"):
+                names.update(_target_names(node.target))
+            for item in getattr(node, "items", []):
+                if item.optional_vars is not None:
+                    names.update(_target_names(item.optional_vars))
+            for field in ("body", "orelse", "finalbody"):
+                if not _statements_names(getattr(node, field, []), names):
+                    return False
+            for handler in getattr(node, "handlers", []):
+                if handler.name:
+                    names.add(handler.name)
+                if not _statements_names(handler.body, names):
+                    return False
+    return "__getattr__" not in names
+
+
+@lru_cache(maxsize=None)
+def _get_module_names(origin):
+    """
+    Return top level names defined in source file of a module,
+    or None if they can not be found statically
+    """
+    try:
+        with open(origin, "rb") as f:
+            tree = ast.parse(f.read(), origin)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    names = set()
+    if not _statements_names(tree.body, names):
+        return None
+    return frozenset(names)
+
+
+def find_string(dotted_path):
+    """
+    Check if an import string exists, like django import_string but without
+    executing its module, parent packages of the module are still imported
+    by importlib.util.find_spec, raise ImportError if it does not exist
+    """
+    try:
+        module_path, class_name = dotted_path.rsplit(".", 1)
+    except ValueError:
+        raise ImportError("%s doesn't look like a module path" % dotted_path)
+
+    module = sys.modules.get(module_path)
+    if module is not None:
+        if not hasattr(module, class_name):
+            raise ImportError('Module "%s" does not define a "%s" attribute/class' % (module_path, class_name))
+        return
+
+    spec = importlib.util.find_spec(module_path)
+    if spec is None:
+        raise ImportError("No module named '%s'" % module_path)
+
+    if not spec.has_location or not spec.origin or not spec.origin.endswith(".py"):
+        return
+    names = _get_module_names(spec.origin)
+    if names is None or class_name in names:
+        return
+    if spec.submodule_search_locations is not None and importlib.util.find_spec(dotted_path) is not None:
+        return
+    raise ImportError('Module "%s" does not define a "%s" attribute/class' % (module_path, class_name))
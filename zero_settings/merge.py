@@ -0,0 +1,60 @@
+MERGE = "merge"
+REPLACE = "replace"
+APPEND = "append"
+
+STRATEGIES = (MERGE, REPLACE, APPEND)
+
+
+def _append(default, value):
+    """
+    Return a list of default items followed by user value items
+    """
+    if not isinstance(value, (list, tuple)):
+        return value
+    return list(default) + list(value)
+
+
+def _compile_merge(default):
+    """
+    Return a function that recursively merges user value into default dict,
+    nested dicts of default are found once here, not on each merge
+    """
+    nested = {}
+    for key, value in default.items():
+        if isinstance(value, dict):
+            nested[key] = _compile_merge(value)
+
+    def merge(default, value):
+        if not isinstance(value, dict):
+            return value
+        merged = dict(default)
+        for key, item in value.items():
+            if key in nested:
+                merged[key] = nested[key](default[key], item)
+            else:
+                merged[key] = item
+        return merged
+
+    return merge
+
+
+def compile_merge_plan(defaults, strategies):
+    """
+    Return a dict of setting: merge function for settings that are not replaced
+    """
+    plan = {}
+    for attr, strategy in strategies.items():
+        if strategy not in STRATEGIES:
+            raise ValueError("merge_strategies values must be one of: %s" % ", ".join(STRATEGIES))
+        if attr not in defaults:
+            raise ValueError("merge_strategies settings must be in defaults")
+
+        if strategy == MERGE:
+            if not isinstance(defaults[attr], dict):
+                raise ValueError("merge strategy requires dict default for setting '%s'" % attr)
+            plan[attr] = _compile_merge(defaults[attr])
+        elif strategy == APPEND:
+            if not isinstance(defaults[attr], (list, tuple)):
+                raise ValueError("append strategy requires list/tuple default for setting '%s'" % attr)
+            plan[attr] = _append
+    return plan
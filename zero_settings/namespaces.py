@@ -0,0 +1,64 @@
+from collections.abc import Mapping
+
+
+class NamespaceSettings(Mapping):
+    """
+    A view of settings with a common prefix, with prefix stripped from keys.
+    Values are projected once from the base settings and projection is
+    removed whenever one of its settings is removed from base cache,
+    namespaces with settings which can expire are projected on each access.
+
+        cache_settings = app_settings.namespace("CACHE_")
+
+        print(cache_settings.HOST)       # app_settings.CACHE_HOST
+        print(dict(cache_settings))      # {"HOST": ..., "PORT": ...}
+    """
+
+    def __init__(self, base, prefix):
+        self._base = base
+        self._prefix = prefix
+        self._projection = None
+
+    def _get_projection(self):
+        """
+        Return dict of stripped keys and values, cache it if use_cache is True
+        and none of its settings can expire, as expiry is only found on access
+        """
+        projection = self._projection
+        if projection is None:
+            base = self._base
+            size = len(self._prefix)
+            attrs = [attr for attr in base._get_keys() if attr.startswith(self._prefix) and not base._is_removed(attr)]
+            projection = {attr[size:]: getattr(base, attr) for attr in attrs}
+            if not any(base._is_live(attr) for attr in attrs):
+                self._projection = projection
+        return projection
+
+    def _clear_cache(self, attr=None):
+        """
+        Remove projection if attr or a computed setting depending on it is in namespace
+        """
+        if not attr:
+            self._projection = None
+        elif any(key.startswith(self._prefix) for key in {attr} | self._base._dependents.get(attr, set())):
+            self._projection = None
+
+    def __getitem__(self, key):
+        return self._get_projection()[key]
+
+    def __iter__(self):
+        return iter(self._get_projection())
+
+    def __len__(self):
+        return len(self._get_projection())
+
+    def __getattr__(self, attr):
+        if attr[:1] == "_":
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, attr))
+        try:
+            return self._get_projection()[attr]
+        except KeyError:
+            raise AttributeError("Invalid setting: '%s.%s%s'" % (self._base._key, self._prefix, attr))
+
+    def __repr__(self):
+        return "NamespaceSettings(%r, %r)" % (self._base._key, self._prefix)
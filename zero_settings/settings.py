@@ -1,13 +1,58 @@
+import asyncio
+import gc
+import itertools
+import logging
+import threading
+import time
+import weakref
+from collections import ChainMap, namedtuple
+from collections.abc import Mapping
+
 from django.conf import settings as django_settings
+from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
 
+from .handles import SettingHandle, _LiveSettingHandle
+from .imports import find_string
+from .merge import compile_merge_plan
+from .namespaces import NamespaceSettings
+from .tenants import TenantCache, TenantSettings
+from .values import CompiledConditional, Computed, Conditional, Secret, freeze, is_positive_number
+
+
+_MISSING = object()
+
+# state which is kept by reload(), as it is shared with views, handles and callers
+_RELOAD_KEPT = (
+    "_tenants",
+    "_generations",
+    "_generation_lock",
+    "_instances_lock",
+    "_handles",
+    "_handles_lock",
+    "_namespaces",
+    "_subscriptions",
+    "_subscriptions_lock",
+    "_loads",
+    "_setup_lock",
+)
+
+SlowAccess = namedtuple("SlowAccess", ("key", "elapsed", "cache_state", "imported"))
+
+
+def _unpickle(cls, kwargs):
+    """
+    Create settings object from its pickled args
+    """
+    return cls(**kwargs)
+
 
 class ZeroSettings:
     """
     A settings object that allows your settings to be accessed as properties.
     Example:
 
-        from zero_settings import ZeroSettings
+        from zero_settings import ZeroSettings, Computed, Factory
 
         app_settings = ZeroSettings(
             # key will be used to get user settings from Django settings
@@ -22,18 +67,34 @@ class ZeroSettings:
                 "TEST_IMPORT_LIST": [
                     "module.file.class_name_1",
                     "module.file.class_name_2",
-                ]
+                ],
+                "TEST_DICT": {"KEY": "key", "NESTED": {"KEY": "key"}},
+                "TEST_LIST": ["item_1"],
+                "TEST_COMPUTED": Computed(
+                    lambda key: key.upper(),
+                    depends_on=["TEST_KEY"],
+                ),
+                "TEST_FACTORY": Factory(lambda: {"key": "value"}),
             },
 
             # manually define or override user settings,
             # by default settings will be loaded from Django settings with key,
-            # optional, can be dict or None
+            # optional, can be dict, mapping like JsonLinesSource or None
             user_settings=None,
 
             # list of settings that must be imported, lazy check,
             # optional, can be list/tuple or None
             import_strings=["TEST_IMPORT", "TEST_IMPORT_LIST"],
 
+            # dict of import strings settings that must be instantiated
+            # once, with kwargs to instantiate them with,
+            # instances are available with instance(setting),
+            # optional, can be dict or None
+            instantiate_strings={
+                "TEST_IMPORT": {"timeout": 10},
+                "TEST_IMPORT_LIST": None,
+            },
+
             # dict of settings that had be removed,
             # message can be None or empty string to show default,
             # optional, can be dict or None
@@ -50,6 +111,17 @@ class ZeroSettings:
             # must be boolean
             use_cache=True,
 
+            # default seconds to cache settings for,
+            # optional, can be positive number or None to cache forever
+            cache_ttl=None,
+
+            # dict of settings seconds to cache for, overrides cache_ttl,
+            # optional, can be dict or None
+            cache_ttls={
+                "TEST_KEY": 60,
+                "TEST_IMPORT": None,
+            },
+
             # whether to be strict on defaults or not,
             # if true, only default keys are valid in user settings,
             # must be boolean
@@ -66,6 +138,50 @@ class ZeroSettings:
             # whether to pre check removed or not
             # must be boolean
             pre_check_removed=True,
+
+            # whether to pre check imports statically or not, if true,
+            # import strings are found without executing their modules
+            # must be boolean
+            static_import_check=False,
+
+            # whether to defer pre checks until first access or not,
+            # if true, settings are only loaded and checked on first
+            # attribute access or an explicit call to _setup()
+            # must be boolean
+            lazy=False,
+
+            # dict of settings that user value must be merged with default,
+            # strategy can be "merge" for dicts, "append" for lists or "replace"
+            # optional, can be dict or None
+            merge_strategies={
+                "TEST_DICT": "merge",
+                "TEST_LIST": "append",
+            },
+
+            # a callable or logger to report settings accesses which took
+            # longer than slow_access_threshold seconds,
+            # callable will be called with a SlowAccess,
+            # optional, can be callable, logging.Logger/LoggerAdapter or None
+            slow_access_hook=logging.getLogger("app.settings"),
+
+            # min seconds of an access to be reported to slow_access_hook
+            # must be positive number
+            slow_access_threshold=0.1,
+
+            # a callable to decrypt Secret settings with,
+            # it gets the ciphertext and returns the decrypted value
+            # optional, can be callable or None
+            secret_decryptor=KeyfileDecryptor("/etc/app/secret.key"),
+
+            # whether to return read only equivalents of list, dict and set
+            # values or not, tuples, MappingProxyType and frozensets
+            # must be boolean
+            freeze_values=False,
+
+            # max number of tenant views to keep, least recently used
+            # views will be evicted
+            # must be positive integer
+            max_tenants=128,
         )
 
         print(app_settings.TEST_KEY)
@@ -87,6 +203,17 @@ class ZeroSettings:
         pre_check_defaults=True,
         pre_check_imports=True,
         pre_check_removed=True,
+        lazy=False,
+        max_tenants=128,
+        instantiate_strings=None,
+        merge_strategies=None,
+        slow_access_hook=None,
+        slow_access_threshold=0.1,
+        secret_decryptor=None,
+        freeze_values=False,
+        static_import_check=False,
+        cache_ttl=None,
+        cache_ttls=None,
     ):
         if isinstance(key, str):
             self._key = key
@@ -105,6 +232,18 @@ class ZeroSettings:
         else:
             raise ValueError("import_strings must be list/tuple of strings or None")
 
+        if not instantiate_strings:
+            self._instantiate_strings = {}
+        elif isinstance(instantiate_strings, dict):
+            for attr, kwargs in instantiate_strings.items():
+                if attr not in self._import_strings:
+                    raise ValueError("instantiate_strings settings must be in import_strings")
+                if kwargs is not None and not isinstance(kwargs, dict):
+                    raise ValueError("instantiate_strings kwargs must be dict or None")
+            self._instantiate_strings = instantiate_strings
+        else:
+            raise ValueError("instantiate_strings must be dict of setting: kwargs or None")
+
         if not removed_settings:
             self._removed_settings = {}
         elif isinstance(removed_settings, dict):
@@ -112,6 +251,14 @@ class ZeroSettings:
         else:
             raise ValueError("removed_settings must be dict of setting: msg or None")
 
+        if not merge_strategies:
+            self._merge_strategies = {}
+        elif isinstance(merge_strategies, dict):
+            self._merge_strategies = merge_strategies
+        else:
+            raise ValueError("merge_strategies must be dict of setting: strategy or None")
+        self._merge_plan = compile_merge_plan(self._defaults, self._merge_strategies)
+
         if not settings_doc:
             self._settings_doc = ""
         elif isinstance(settings_doc, str):
@@ -121,16 +268,31 @@ class ZeroSettings:
 
         if not user_settings:
             self._user_settings = {}
-        elif isinstance(user_settings, dict):
+        elif isinstance(user_settings, Mapping):
             self._user_settings = user_settings
         else:
-            raise ValueError("user_settings must be dict or None")
+            raise ValueError("user_settings must be dict, mapping or None")
 
         if isinstance(use_cache, bool):
             self._use_cache = use_cache
         else:
             raise ValueError("use_cache must be boolean")
 
+        if cache_ttl is None or is_positive_number(cache_ttl):
+            self._cache_ttl = cache_ttl
+        else:
+            raise ValueError("cache_ttl must be positive number or None")
+
+        if not cache_ttls:
+            self._cache_ttls = {}
+        elif isinstance(cache_ttls, dict):
+            for ttl in cache_ttls.values():
+                if not (ttl is None or is_positive_number(ttl)):
+                    raise ValueError("cache_ttls values must be positive number or None")
+            self._cache_ttls = cache_ttls
+        else:
+            raise ValueError("cache_ttls must be dict of setting: ttl or None")
+
         if isinstance(strict_defaults, bool):
             self._strict_defaults = strict_defaults
         else:
@@ -138,27 +300,160 @@ class ZeroSettings:
 
         if isinstance(pre_check_imports, bool):
             self._pre_check_imports = pre_check_imports
-            if self._pre_check_imports:
-                self._check_import_strings(self._import_strings)
         else:
             raise ValueError("pre_check_imports must be boolean")
 
         if isinstance(pre_check_removed, bool):
             self._pre_check_removed = pre_check_removed
-            if self._pre_check_removed:
-                self._check_removed_settings(self._get_user_settings())
-                self._check_removed_settings(self._defaults)
         else:
             raise ValueError("pre_check_removed must be boolean")
 
         if isinstance(pre_check_defaults, bool):
             self._pre_check_defaults = pre_check_defaults
-            if self._pre_check_defaults and self._strict_defaults:
-                self._check_defaults(self._get_user_settings())
         else:
             raise ValueError("pre_check_defaults must be boolean")
 
+        if isinstance(static_import_check, bool):
+            self._static_import_check = static_import_check
+        else:
+            raise ValueError("static_import_check must be boolean")
+
+        if isinstance(lazy, bool):
+            self._lazy = lazy
+        else:
+            raise ValueError("lazy must be boolean")
+
+        if isinstance(max_tenants, int) and not isinstance(max_tenants, bool) and max_tenants > 0:
+            self._max_tenants = max_tenants
+            self._tenants = TenantCache(max_tenants)
+        else:
+            raise ValueError("max_tenants must be positive integer")
+
+        if (
+            slow_access_hook is None
+            or callable(slow_access_hook)
+            or isinstance(slow_access_hook, (logging.Logger, logging.LoggerAdapter))
+        ):
+            self._slow_access_hook = slow_access_hook
+        else:
+            raise ValueError("slow_access_hook must be callable, logger or None")
+
+        if is_positive_number(slow_access_threshold):
+            self._slow_access_threshold = slow_access_threshold
+        else:
+            raise ValueError("slow_access_threshold must be positive number")
+
+        if secret_decryptor is None or callable(secret_decryptor):
+            self._secret_decryptor = secret_decryptor
+        else:
+            raise ValueError("secret_decryptor must be callable or None")
+
+        if isinstance(freeze_values, bool):
+            self._freeze_values = freeze_values
+        else:
+            raise ValueError("freeze_values must be boolean")
+
+        self._dependents = self._get_dependents()
         self._cached_attrs = set()
+        self._missing = set()
+        self._ttl_cache = {}
+        self._imported = {}
+        self._import_count = 0
+        self._secrets = {}
+        self._generations = itertools.count(1)
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._instances = {}
+        self._instances_lock = threading.Lock()
+        self._handles = weakref.WeakValueDictionary()
+        self._handles_lock = threading.Lock()
+        self._namespaces = {}
+        self._subscriptions = []
+        self._subscriptions_lock = threading.Lock()
+        self._loads = {}
+        self._setup_lock = threading.Lock()
+        self._is_setup = False
+
+        setting_changed.connect(self._setting_changed)
+
+        if not self._lazy:
+            self._setup()
+
+    def _setup(self):
+        """
+        Run pre checks only once, lazy settings call this on first access,
+        it is safe to call it from multiple threads or AppConfig.ready()
+        """
+        if self._is_setup:
+            return
+        with self._setup_lock:
+            if not self._is_setup:
+                self._pre_check()
+                self._is_setup = True
+
+    def _pre_check(self):
+        """
+        Run enabled pre checks on imports, removed and defaults
+        """
+        if self._pre_check_imports:
+            if self._static_import_check:
+                self._find_import_strings(self._import_strings)
+            else:
+                self._check_import_strings(self._import_strings)
+
+        if self._pre_check_removed:
+            self._check_removed_settings(self._get_user_settings())
+            self._check_removed_settings(self._defaults)
+
+        if self._pre_check_defaults and self._strict_defaults:
+            self._check_defaults(self._get_user_settings())
+
+    def _get_init_kwargs(self):
+        """
+        Return args which settings object had been created with
+        """
+        return {
+            "key": self._key,
+            "defaults": self._defaults,
+            "user_settings": self._user_settings,
+            "import_strings": self._import_strings,
+            "removed_settings": self._removed_settings,
+            "settings_doc": self._settings_doc,
+            "use_cache": self._use_cache,
+            "strict_defaults": self._strict_defaults,
+            "pre_check_defaults": self._pre_check_defaults,
+            "pre_check_imports": self._pre_check_imports,
+            "pre_check_removed": self._pre_check_removed,
+            "lazy": self._lazy,
+            "max_tenants": self._max_tenants,
+            "instantiate_strings": self._instantiate_strings,
+            "merge_strategies": self._merge_strategies,
+            "slow_access_hook": self._slow_access_hook,
+            "slow_access_threshold": self._slow_access_threshold,
+            "secret_decryptor": self._secret_decryptor,
+            "freeze_values": self._freeze_values,
+            "static_import_check": self._static_import_check,
+            "cache_ttl": self._cache_ttl,
+            "cache_ttls": self._cache_ttls,
+        }
+
+    def __reduce__(self):
+        """
+        Pickle only args and local user settings, cached, imported and Django
+        settings are not included, and the unpickled object is lazy
+        """
+        kwargs = self._get_init_kwargs()
+        kwargs["lazy"] = True
+        return (_unpickle, (self.__class__, kwargs))
+
+    def _get_keys(self):
+        """
+        Return all setting keys, including user settings keys if not strict defaults
+        """
+        keys = list(self._defaults)
+        if not self._strict_defaults:
+            keys.extend(attr for attr in self._settings if attr not in self._defaults)
+        return keys
 
     def _has_default(self, attr):
         """
@@ -178,27 +473,234 @@ class ZeroSettings:
         """
         return attr in self._import_strings
 
+    def _get_dependents(self):
+        """
+        Return a map of settings to computed settings that depend on them,
+        directly or through other computed settings
+        """
+        direct = {}
+        for attr, value in self._defaults.items():
+            if isinstance(value, Computed):
+                for dependency in value.depends_on:
+                    direct.setdefault(dependency, set()).add(attr)
+
+        dependents = {}
+        for attr in direct:
+            found = set()
+            stack = list(direct[attr])
+            while stack:
+                dependent = stack.pop()
+                if dependent == attr:
+                    raise ValueError("computed setting '%s.%s' has circular dependencies" % (self._key, attr))
+                if dependent not in found:
+                    found.add(dependent)
+                    stack.extend(direct.get(dependent, ()))
+            dependents[attr] = found
+        return dependents
+
     def _cache(self, attr, value):
         """
-        Cache and set class attr if use_cache is True
+        Cache and set class attr if use_cache is True,
+        attrs with ttl are cached separately until they expire
         """
         if self._use_cache:
-            self._cached_attrs.add(attr)
-            setattr(self, attr, value)
+            ttl = self._cache_ttls.get(attr, self._cache_ttl)
+            if ttl is None:
+                self._cached_attrs.add(attr)
+                setattr(self, attr, value)
+            else:
+                self._ttl_cache[attr] = (value, time.monotonic() + ttl)
 
     def _clear_cache(self, attr=None):
         """
-        Remove cached attrs and settings
+        Remove cached attrs and settings,
+        removing an attr also removes computed settings depending on it
         """
         if not attr:
-            for attr in self._cached_attrs:
-                delattr(self, attr)
+            for cached_attr in self._cached_attrs:
+                delattr(self, cached_attr)
             self._cached_attrs.clear()
-            if hasattr(self, "_cached_settings"):
+            self._missing.clear()
+            self._ttl_cache.clear()
+            if "_cached_settings" in self.__dict__:
                 delattr(self, "_cached_settings")
+            self._imported.clear()
+            self._secrets.clear()
+            self._close_instances(self._instances)
+
+        elif attr:
+            for cached_attr in {attr} | self._dependents.get(attr, set()):
+                if cached_attr in self.__dict__:
+                    delattr(self, cached_attr)
+                    self._cached_attrs.discard(cached_attr)
+                self._ttl_cache.pop(cached_attr, None)
+            self._missing.discard(attr)
+            self._secrets.pop(attr, None)
+            self._close_instances(self._instances, attr)
+
+        for view in self._tenants:
+            view._clear_cache(attr)
+        for namespace in list(self._namespaces.values()):
+            namespace._clear_cache(attr)
+
+        self._next_generation()
+        self._invalidate_handles(attr)
+        self._notify_subscribers()
+
+    def _invalidate_handles(self, attr=None):
+        """
+        Mark handles of all or one attr and its dependents stale, so they are
+        resolved on next read, and invalid settings only raise there
+        """
+        if not attr:
+            handles = list(self._handles.values())
+        else:
+            handles = [self._handles.get(key) for key in {attr} | self._dependents.get(attr, set())]
+
+        for handle in handles:
+            if handle is not None:
+                handle._mark_stale()
+
+    def _next_generation(self):
+        """
+        Increase generation, drawing and storing it under a lock so a
+        smaller generation is never stored after a larger one
+        """
+        with self._generation_lock:
+            self._generation = next(self._generations)
 
-        elif attr and hasattr(self, attr):
-            delattr(self, attr)
+    def _setting_changed(self, setting, **kwargs):
+        """
+        Load user settings again when they are overridden, so settings which
+        are not cached see the override, increase generation and notify
+        subscribers, which changed settings are removed from cache first
+        """
+        if setting == self._key:
+            self.__dict__.pop("_cached_settings", None)
+            self._next_generation()
+            self._notify_subscribers(evict=True)
+
+    def _get_raw(self, attr, settings):
+        """
+        Return unresolved value of attr in settings, or _MISSING,
+        computed values include raw values of their dependencies
+        """
+        value = settings.get(attr, _MISSING)
+        if value is _MISSING:
+            value = self._defaults.get(attr, _MISSING)
+        if isinstance(value, Computed):
+            return value, tuple(self._get_raw(dependency, settings) for dependency in value.depends_on)
+        return value
+
+    def _notify_subscribers(self, evict=False):
+        """
+        Call subscribers of settings which their values are changed, once
+        with the changed settings, which are removed from cache first if
+        evict is True, so callbacks get their new values
+        """
+        if not self._subscriptions:
+            return
+
+        settings = self._get_user_settings()
+        notify = []
+        with self._subscriptions_lock:
+            for keys, callback, snapshot in self._subscriptions:
+                changed = set()
+                for key in keys:
+                    value = self._get_raw(key, settings)
+                    if value != snapshot[key]:
+                        snapshot[key] = value
+                        changed.add(key)
+                if changed:
+                    notify.append((callback, changed))
+
+        if evict and notify:
+            # computed settings are evicted with their dependencies, which may be cached too
+            evicted = set()
+            stack = list(set().union(*[changed for _, changed in notify]))
+            while stack:
+                key = stack.pop()
+                if key not in evicted:
+                    evicted.add(key)
+                    if isinstance(self._defaults.get(key), Computed):
+                        stack.extend(self._defaults[key].depends_on)
+            for key in evicted:
+                self._clear_cache(key)
+
+        for callback, changed in notify:
+            callback(changed)
+
+    @property
+    def generation(self):
+        """
+        Return an integer which increases on each clear cache and override,
+        can be used to check freshness of values derived from settings
+        """
+        return self._generation
+
+    def _close_instances(self, instances, attr=None):
+        """
+        Remove instances of all or one attr and close them if possible
+        """
+        with self._instances_lock:
+            if not attr:
+                removed = list(instances.values())
+                instances.clear()
+            elif attr in instances:
+                removed = [instances.pop(attr)]
+            else:
+                removed = []
+
+        for instance in removed:
+            for obj in instance if isinstance(instance, list) else [instance]:
+                close = getattr(obj, "close", None)
+                if callable(close):
+                    close()
+
+    def _instantiate(self, value, attr):
+        """
+        Instantiate imported value of attr with its kwargs
+        """
+        kwargs = self._instantiate_strings[attr] or {}
+        if value is None:
+            return None
+        elif isinstance(value, list):
+            return [item(**kwargs) for item in value]
+        return value(**kwargs)
+
+    def _get_instance(self, settings, instances, attr):
+        """
+        Return instance of attr for settings, create and cache it if not exists
+        """
+        if attr not in self._instantiate_strings:
+            raise AttributeError("Invalid instance setting: '%s.%s'" % (self._key, attr))
+        # attr is resolved before taking the lock, as an expired ttl closes instances
+        value = getattr(settings, attr)
+        if not self._use_cache:
+            return self._instantiate(value, attr)
+
+        with self._instances_lock:
+            if attr not in instances:
+                instances[attr] = self._instantiate(value, attr)
+            return instances[attr]
+
+    def _reveal(self, attr, secret, secrets):
+        """
+        Return decrypted value of secret, which is cached in secrets until
+        its ttl is expired
+        """
+        if secret.ttl is not None and attr in secrets:
+            plaintext, expires_at = secrets[attr]
+            if time.monotonic() < expires_at:
+                return plaintext
+
+        if self._secret_decryptor is None:
+            raise ValueError("secret_decryptor is required to decrypt setting '%s.%s'" % (self._key, attr))
+        plaintext = self._secret_decryptor(secret.ciphertext)
+
+        if secret.ttl is not None and self._use_cache:
+            secrets[attr] = (plaintext, time.monotonic() + secret.ttl)
+        return plaintext
 
     def _check_removed(self, attr):
         """
@@ -239,8 +741,11 @@ class ZeroSettings:
         """
         Attempt to import setting from a string representation.
         """
+        if value in self._imported:
+            return self._imported[value]
+        self._import_count += 1
         try:
-            return import_string(value)
+            imported = import_string(value)
         except ImportError as e:
             msg = "Could not import '%s' for setting '%s.%s'. %s." % (
                 value,
@@ -250,6 +755,10 @@ class ZeroSettings:
             )
             raise ImportError(msg)
 
+        if self._use_cache:
+            self._imported[value] = imported
+        return imported
+
     def _perform_import(self, value, attr):
         """
         If the given setting is a string import notation,
@@ -277,11 +786,42 @@ class ZeroSettings:
         for attr in import_strings:
             self._import(attr)
 
+    def _find_from_string(self, value, attr):
+        """
+        Check if setting string representation can be imported,
+        without executing its module
+        """
+        try:
+            find_string(value)
+        except ImportError as e:
+            msg = "Could not import '%s' for setting '%s.%s'. %s." % (
+                value,
+                self._key,
+                attr,
+                e,
+            )
+            raise ImportError(msg)
+
+    def _find_import_strings(self, import_strings):
+        """
+        Check if all import strings are valid statically
+        """
+        for attr in import_strings:
+            value = self._getattr(attr)
+            if isinstance(value, str):
+                self._find_from_string(value, attr)
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    self._find_from_string(item, attr)
+
     def _get_user_settings(self):
         """
         Get and update user settings with provided key
         """
         _cached_settings = getattr(django_settings, self._key, {})
+        if not isinstance(self._user_settings, dict):
+            # keep mapping sources lazy, instead of copying all of their values
+            return ChainMap(self._user_settings, _cached_settings)
         if self._user_settings:
             _cached_settings.update(self._user_settings)
 
@@ -293,35 +833,353 @@ class ZeroSettings:
         Return cached settings or create one
         """
         if self._use_cache:
-            if not hasattr(self, "_cached_settings"):
+            if "_cached_settings" not in self.__dict__:
                 self._cached_settings = self._get_user_settings()
             return self._cached_settings
         else:
             return self._get_user_settings()
 
+    def _lookup(self, attr):
+        """
+        Return settings attr or _MISSING, without raising KeyError,
+        user value is merged with default if attr has a merge strategy
+        """
+        value = self._settings.get(attr, _MISSING)
+        if value is _MISSING:
+            return self._defaults.get(attr, _MISSING)
+
+        if attr in self._merge_plan:
+            return self._merge_plan[attr](self._defaults[attr], value)
+        return value
+
     def _getattr(self, attr):
         """
         Return settings attr or raise error
         """
-        try:
-            try:
-                return self._settings[attr]
-            except KeyError:
-                return self._defaults[attr]
-        except:
+        value = self._lookup(attr)
+        if value is _MISSING:
             raise AttributeError("Invalid setting: '%s.%s'" % (self._key, attr))
+        return value
+
+    def subscribe(self, keys, callback):
+        """
+        Call callback with set of changed keys, whenever values of some of
+        keys are changed by a clear cache or an override
+        """
+        if not isinstance(keys, (list, tuple)) or not all(isinstance(key, str) for key in keys):
+            raise ValueError("keys must be list/tuple of strings")
+        if not callable(callback):
+            raise ValueError("callback must be callable")
+
+        settings = self._get_user_settings()
+        snapshot = {key: self._get_raw(key, settings) for key in keys}
+        with self._subscriptions_lock:
+            self._subscriptions.append((tuple(keys), callback, snapshot))
+
+    def unsubscribe(self, callback):
+        """
+        Remove subscriptions of callback
+        """
+        with self._subscriptions_lock:
+            self._subscriptions = [subscription for subscription in self._subscriptions if subscription[1] != callback]
+
+    def resolve(self, attr, context):
+        """
+        Return value of a conditional settings attr for context,
+        or value of attr if it is not conditional
+        """
+        value = getattr(self, attr)
+        if isinstance(value, CompiledConditional):
+            return value(context)
+        return value
+
+    def handle(self, attr):
+        """
+        Return a handle of attr, which its value is resolved again on next
+        read whenever attr is removed from cache, handles are shared while
+        they are referenced
+        """
+        handle = self._handles.get(attr)
+        if handle is None:
+            value = getattr(self, attr)
+            with self._handles_lock:
+                handle = self._handles.get(attr)
+                if handle is None:
+                    handle = SettingHandle(attr, value, self)
+                    if self._is_live(attr):
+                        handle.__class__ = _LiveSettingHandle
+                    self._handles[attr] = handle
+        return handle
+
+    def _is_live(self, attr):
+        """
+        Return True if attr is not cached or can expire, directly or through
+        a setting it depends on, so its handle must resolve it on each read
+        """
+        if not self._use_cache:
+            return True
+        keys = [attr] + [key for key, dependents in self._dependents.items() if attr in dependents]
+        return any(self._cache_ttls.get(key, self._cache_ttl) is not None for key in keys)
+
+    def get(self, attr, default=None):
+        """
+        Return settings attr, or default if attr is not a valid setting,
+        invalid settings are cached, and no error is raised or formatted
+        for them, errors of removed settings and imports are still raised
+        """
+        if attr in self._cached_attrs:
+            value = self.__dict__.get(attr, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        if attr in self._missing or (attr[:1] == "_" and attr not in self._defaults):
+            return default
+
+        if not self._is_setup:
+            self._setup()
+
+        self._check_removed(attr)
+        if (self._strict_defaults and not self._has_default(attr)) or self._lookup(attr) is _MISSING:
+            if self._use_cache:
+                self._missing.add(attr)
+            return default
+        return getattr(self, attr)
+
+    async def aget(self, attr):
+        """
+        Return settings attr without blocking event loop, cached settings
+        are returned directly, others are resolved in default executor of
+        loop, and concurrent loads of the same attr share one resolve
+        """
+        if attr in self._cached_attrs:
+            value = self.__dict__.get(attr, _MISSING)
+            if value is not _MISSING:
+                return value
+        value, expires_at = self._ttl_cache.get(attr, (None, 0))
+        if time.monotonic() < expires_at:
+            return value
+
+        loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+        key = (loop, attr)
+        load = self._loads.get(key)
+        if load is None:
+            load = loop.run_in_executor(None, getattr, self, attr)
+            self._loads[key] = load
+            load.add_done_callback(lambda _: self._loads.pop(key, None))
+        # a cancelled caller must not cancel the load of other callers
+        return await asyncio.shield(load)
+
+    async def aget_many(self, attrs):
+        """
+        Return a dict of settings attrs, resolved concurrently with aget()
+        """
+        values = await asyncio.gather(*[self.aget(attr) for attr in attrs])
+        return dict(zip(attrs, values))
+
+    def warm(self, freeze=True):
+        """
+        Resolve and cache all settings and import strings, then move all gc
+        tracked objects to permanent generation if freeze is True,
+        to be called in master process before forking workers, so workers
+        share warm cache pages instead of resolving settings themselves
+        """
+        self._setup()
+        for attr in self._get_keys():
+            if not self._is_removed(attr):
+                getattr(self, attr)
+
+        if freeze and hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+
+    def reload(self):
+        """
+        Load and resolve all settings again on a new settings object, and
+        swap its state in with one assignment, so readers see either old or
+        new settings, if loading fails, error is raised and old state is kept
+        """
+        staging = self.__class__(**self._get_init_kwargs())
+        staging.warm(freeze=False)
+
+        state = dict(staging.__dict__)
+        for name in _RELOAD_KEPT:
+            state[name] = self.__dict__[name]
+        # generation is increased with the swap, under the lock values are cached
+        # with, so values resolved from old state are never cached in new state
+        with self._generation_lock:
+            state["_generation"] = next(self._generations)
+            old_state, self.__dict__ = self.__dict__, state
+
+        self._close_instances(old_state["_instances"])
+        for view in self._tenants:
+            view._clear_cache()
+        for namespace in list(self._namespaces.values()):
+            namespace._clear_cache()
+        self._invalidate_handles()
+        self._notify_subscribers()
+
+    def instance(self, attr):
+        """
+        Return instance of an instantiate strings setting, which is created
+        only once and is closed and removed on clear cache
+        """
+        return self._get_instance(self, self._instances, attr)
+
+    def for_tenant(self, tenant_id, overrides=None):
+        """
+        Return a view of settings for tenant, which only stores overrides,
+        views are kept in an LRU and reused while overrides are the same
+        """
+        view = self._tenants.get(tenant_id)
+        if view is not None and (overrides is None or overrides == view._overrides):
+            return view
+
+        if overrides is None:
+            overrides = {}
+        elif not isinstance(overrides, dict):
+            raise ValueError("overrides must be dict or None")
+
+        view = TenantSettings(self, tenant_id, dict(overrides))
+        # instances of replaced and evicted views are closed outside of cache lock
+        for old_view in self._tenants.set(tenant_id, view):
+            self._close_instances(old_view._instances)
+        return view
+
+    def namespace(self, prefix):
+        """
+        Return a view of settings starting with prefix, with prefix stripped,
+        which is available as attributes and as a mapping
+        """
+        if not isinstance(prefix, str) or not prefix:
+            raise ValueError("prefix must be non empty string")
+
+        namespace = self._namespaces.get(prefix)
+        if namespace is None:
+            namespace = self._namespaces.setdefault(prefix, NamespaceSettings(self, prefix))
+        return namespace
+
+    def tenant_stats(self):
+        """
+        Return number of tenant views and their overrides size in bytes
+        """
+        return self._tenants.stats()
 
     def __getattr__(self, attr):
         """
         Return settings attr and cache if use_cache is True
         """
+        if attr[:1] == "_" and attr not in self.__dict__.get("_defaults", ()):
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, attr))
+
+        if self._slow_access_hook is None:
+            return self._load(attr)
+        return self._trace(attr)
+
+    def _load(self, attr):
+        """
+        Setup if lazy, then return attr from ttl cache or resolve it
+        """
+        if not self._is_setup:
+            self._setup()
+
+        if attr in self._ttl_cache:
+            value, expires_at = self._ttl_cache.get(attr, (None, 0))
+            if time.monotonic() < expires_at:
+                return value
+            self._expire(attr)
+
+        return self._resolve(attr)
+
+    def _expire(self, attr):
+        """
+        Remove an expired attr from cache, and load settings again,
+        so it will be resolved from current settings
+        """
+        self.__dict__.pop("_cached_settings", None)
+        self._clear_cache(attr)
+
+    def _trace(self, attr):
+        """
+        Load attr and report it to slow access hook if it took too long,
+        including lazy setup and pre checks of first access
+        """
+        if not self._use_cache:
+            cache_state = "disabled"
+        elif "_cached_settings" in self.__dict__:
+            cache_state = "warm"
+        else:
+            cache_state = "cold"
+        import_count = self._import_count
+
+        start = time.perf_counter()
+        try:
+            return self._load(attr)
+        finally:
+            elapsed = time.perf_counter() - start
+            if elapsed >= self._slow_access_threshold:
+                self._report_slow_access(SlowAccess(attr, elapsed, cache_state, self._import_count != import_count))
+
+    def _report_slow_access(self, slow_access):
+        """
+        Log slow access or call slow access hook with it
+        """
+        if isinstance(self._slow_access_hook, (logging.Logger, logging.LoggerAdapter)):
+            self._slow_access_hook.warning(
+                "Slow access to setting '%s.%s' took %.6fs (cache: %s, imported: %s)",
+                self._key,
+                slow_access.key,
+                slow_access.elapsed,
+                slow_access.cache_state,
+                slow_access.imported,
+            )
+        else:
+            self._slow_access_hook(slow_access)
+
+    def _resolve(self, attr):
+        """
+        Check, resolve and cache settings attr
+        """
         self._check_removed(attr)
-        self._check_default_exists(attr)
+        if attr in self._missing:
+            raise AttributeError("Invalid setting: '%s.%s'" % (self._key, attr))
 
-        value = self._getattr(attr)
+        # values resolved before a clear cache or reload must not be cached after it
+        generation = self._generation
+        try:
+            self._check_default_exists(attr)
+            value = self._getattr(attr)
+        except AttributeError:
+            if self._use_cache:
+                self._missing.add(attr)
+            raise
+
+        if isinstance(value, Secret):
+            plaintext = self._reveal(attr, value, self._secrets)
+            if value.ttl is None:
+                self._cache_resolved(attr, plaintext, generation)
+            return plaintext
+
+        if isinstance(value, Computed):
+            value = value.compute(self)
+
+        if isinstance(value, Conditional):
+            value = value.compile("%s.%s" % (self._key, attr))
 
         if self._is_import(attr):
             value = self._perform_import(value, attr)
 
-        self._cache(attr, value)
+        if self._freeze_values:
+            value = freeze(value)
+
+        self._cache_resolved(attr, value, generation)
         return value
+
+    def _cache_resolved(self, attr, value, generation):
+        """
+        Cache value of attr resolved at generation, if cache is not cleared
+        or reloaded since then, checked under the lock reload() swaps with
+        """
+        if self._use_cache:
+            with self._generation_lock:
+                if generation == self._generation:
+                    self._cache(attr, value)
@@ -0,0 +1,118 @@
+import json
+import mmap
+import os
+from collections.abc import Mapping
+
+
+class JsonLinesSource(Mapping):
+    """
+    A read only mapping of settings stored in a JSON lines file, which each
+    line is a JSON object of settings. Example:
+
+        from zero_settings import ZeroSettings, JsonLinesSource
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={},
+            user_settings=JsonLinesSource("/etc/app/flags.jsonl"),
+            strict_defaults=False,
+        )
+
+    The file is memory mapped and only offsets of keys are kept in memory,
+    values are decoded on lookup. Offsets are stored in an index file next
+    to the file, or at index_path, and are found again if file changes.
+    """
+
+    def __init__(self, path, index_path=None):
+        if isinstance(path, str):
+            self.path = path
+        else:
+            raise ValueError("path must be string")
+
+        if index_path is None:
+            self.index_path = path + ".index"
+        elif isinstance(index_path, str):
+            self.index_path = index_path
+        else:
+            raise ValueError("index_path must be string or None")
+
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        self._index = self._load_index(stat) or self._build_index(stat)
+
+    def _load_index(self, stat):
+        """
+        Return offsets of stored index, or None if it does not exist or is outdated
+        """
+        try:
+            with open(self.index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get("size") != stat.st_size or index.get("mtime") != stat.st_mtime_ns:
+            return None
+        return index.get("offsets")
+
+    def _build_index(self, stat):
+        """
+        Find offsets of all keys and store them, storing index may fail on
+        read only locations, which only makes next loads slower
+        """
+        offsets = {}
+        start = 0
+        number = 0
+        size = len(self._mmap)
+        while start < size:
+            end = self._mmap.find(b"\n", start)
+            end = size if end == -1 else end + 1
+            number += 1
+            line = self._mmap[start:end]
+            if line.strip():
+                for key in self._decode(line, number):
+                    offsets[key] = [start, end - start, number]
+            start = end
+
+        tmp_path = "%s.%d.tmp" % (self.index_path, os.getpid())
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"size": stat.st_size, "mtime": stat.st_mtime_ns, "offsets": offsets}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+        return offsets
+
+    def _decode(self, line, number):
+        """
+        Return settings of a line
+        """
+        try:
+            settings = json.loads(line.decode("utf-8"))
+        except ValueError as e:
+            raise ValueError("Invalid JSON at line %d of '%s'. %s." % (number, self.path, e))
+        if not isinstance(settings, dict):
+            raise ValueError("Invalid JSON at line %d of '%s'. line must be an object." % (number, self.path))
+        return settings
+
+    def __getitem__(self, key):
+        start, length, number = self._index[key]
+        return self._decode(self._mmap[start : start + length], number)[key]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __reduce__(self):
+        return self.__class__, (self.path, self.index_path)
+
+    def close(self):
+        """
+        Close memory mapped file
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
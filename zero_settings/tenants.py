@@ -0,0 +1,208 @@
+import sys
+import threading
+from collections import OrderedDict
+
+from .values import CompiledConditional, Computed, Conditional, Secret, freeze
+
+
+class TenantSettings:
+    """
+    A per tenant view of a ZeroSettings object.
+    Only tenant overrides are stored on the view, any other key is read from
+    the base settings, so resolved values and imports are shared with it.
+    Computed settings depending on overrides are computed on the view.
+
+        tenant_settings = app_settings.for_tenant("tenant_1", {"TOKEN": "token_1"})
+
+        print(tenant_settings.TOKEN)     # token_1, from overrides
+        print(tenant_settings.URL)       # from base settings and its cache
+    """
+
+    def __init__(self, base, tenant_id, overrides):
+        self._base = base
+        self._tenant_id = tenant_id
+        self._overrides = overrides
+        self._cached_attrs = set()
+        self._instances = {}
+        self._secrets = {}
+        self._local_attrs = set(overrides)
+        for attr in overrides:
+            self._local_attrs.update(base._dependents.get(attr, ()))
+
+        if base._pre_check_removed:
+            base._check_removed_settings(overrides)
+        if base._pre_check_defaults and base._strict_defaults:
+            base._check_defaults(overrides)
+
+        self._nbytes = self._get_nbytes()
+
+    def _get_nbytes(self):
+        """
+        Return approximate size of overrides in bytes
+        """
+        nbytes = sys.getsizeof(self._overrides)
+        for attr, value in self._overrides.items():
+            nbytes += sys.getsizeof(attr) + sys.getsizeof(value)
+        return nbytes
+
+    def _clear_cache(self, attr=None):
+        """
+        Remove cached override attrs
+        """
+        if not attr:
+            for cached_attr in self._cached_attrs:
+                delattr(self, cached_attr)
+            self._cached_attrs.clear()
+            self._secrets.clear()
+
+        else:
+            for cached_attr in {attr} | self._base._dependents.get(attr, set()):
+                if cached_attr in self.__dict__:
+                    delattr(self, cached_attr)
+                    self._cached_attrs.discard(cached_attr)
+            self._secrets.pop(attr, None)
+
+        self._base._close_instances(self._instances, attr)
+
+    def instance(self, attr):
+        """
+        Return instance of an instantiate strings setting,
+        base settings instance is returned if attr is not overridden
+        """
+        if attr not in self._local_attrs:
+            return self._base.instance(attr)
+        return self._base._get_instance(self, self._instances, attr)
+
+    def get(self, attr, default=None):
+        """
+        Return settings attr, or default if attr is not a valid setting
+        """
+        if attr not in self._local_attrs:
+            return self._base.get(attr, default)
+        return getattr(self, attr)
+
+    def resolve(self, attr, context):
+        """
+        Return value of a conditional settings attr for context,
+        or value of attr if it is not conditional
+        """
+        value = getattr(self, attr)
+        if isinstance(value, CompiledConditional):
+            return value(context)
+        return value
+
+    def __getattr__(self, attr):
+        """
+        Return override or computed attr and cache it if base use_cache is True,
+        or fallback to base settings attr
+        """
+        base = self.__dict__.get("_base")
+        if attr[:1] == "_" and (base is None or attr not in base._defaults):
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, attr))
+
+        if attr not in self._local_attrs:
+            return getattr(base, attr)
+
+        if not base._is_setup:
+            base._setup()
+
+        base._check_removed(attr)
+        base._check_default_exists(attr)
+
+        if attr in self._overrides:
+            value = self._overrides[attr]
+            if attr in base._merge_plan:
+                value = base._merge_plan[attr](base._getattr(attr), value)
+        else:
+            value = base._getattr(attr)
+
+        if isinstance(value, Secret):
+            plaintext = base._reveal(attr, value, self._secrets)
+            if value.ttl is None and base._use_cache:
+                self._cached_attrs.add(attr)
+                setattr(self, attr, plaintext)
+            return plaintext
+
+        if isinstance(value, Computed):
+            value = value.compute(self)
+
+        if isinstance(value, Conditional):
+            value = value.compile("%s.%s" % (base._key, attr))
+
+        if base._is_import(attr):
+            value = base._perform_import(value, attr)
+
+        if base._freeze_values:
+            value = freeze(value)
+
+        if base._use_cache:
+            self._cached_attrs.add(attr)
+            setattr(self, attr, value)
+        return value
+
+
+class TenantCache:
+    """
+    A bounded LRU of tenant views, which keeps track of their overrides size
+    """
+
+    def __init__(self, maxsize):
+        self._maxsize = maxsize
+        self._views = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._views)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._views.values()))
+
+    def get(self, tenant_id):
+        """
+        Return tenant view and mark it as recently used, or None
+        """
+        with self._lock:
+            view = self._views.get(tenant_id)
+            if view is not None:
+                self._views.move_to_end(tenant_id)
+            return view
+
+    def set(self, tenant_id, view):
+        """
+        Add or replace tenant view and evict least recently used views,
+        return replaced and evicted views
+        """
+        removed = []
+        with self._lock:
+            old_view = self._views.pop(tenant_id, None)
+            if old_view is not None:
+                self._nbytes -= old_view._nbytes
+                removed.append(old_view)
+            self._views[tenant_id] = view
+            self._nbytes += view._nbytes
+            while len(self._views) > self._maxsize:
+                _, old_view = self._views.popitem(last=False)
+                self._nbytes -= old_view._nbytes
+                removed.append(old_view)
+        return removed
+
+    def clear(self):
+        """
+        Remove all tenant views
+        """
+        with self._lock:
+            self._views.clear()
+            self._nbytes = 0
+
+    def stats(self):
+        """
+        Return number of tenant views and their overrides size in bytes
+        """
+        with self._lock:
+            return {
+                "tenants": len(self._views),
+                "maxsize": self._maxsize,
+                "nbytes": self._nbytes,
+            }
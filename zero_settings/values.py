@@ -0,0 +1,233 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+from zlib import crc32
+
+_MISSING = object()
+
+
+def is_positive_number(value):
+    """
+    True if value is a positive int or float
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def freeze(value):
+    """
+    Return a read only equivalent of value, lists and tuples are converted
+    to tuples, dicts to MappingProxyType and sets to frozensets, recursively
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+class Computed:
+    """
+    A default setting which is computed from other settings.
+    Example:
+
+        from zero_settings import ZeroSettings, Computed
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={
+                "HOST": "localhost",
+                "PORT": 8000,
+                "URL": Computed(
+                    lambda host, port: "http://%s:%s" % (host, port),
+                    depends_on=["HOST", "PORT"],
+                ),
+            },
+        )
+
+        print(app_settings.URL)
+
+    The function is called with values of depends_on settings in order,
+    result is cached like other settings, and it will be computed again
+    only if one of depends_on settings is removed from cache.
+    """
+
+    def __init__(self, func, depends_on=None):
+        if callable(func):
+            self.func = func
+        else:
+            raise ValueError("func must be callable")
+
+        if not depends_on:
+            self.depends_on = ()
+        elif isinstance(depends_on, (list, tuple)):
+            self.depends_on = tuple(depends_on)
+        else:
+            raise ValueError("depends_on must be list/tuple of strings or None")
+
+    def compute(self, settings):
+        """
+        Return result of func called with depends_on values of settings
+        """
+        return self.func(*[getattr(settings, attr) for attr in self.depends_on])
+
+
+class Factory(Computed):
+    """
+    A default setting which is built by calling func on first access.
+    Example:
+
+        from zero_settings import ZeroSettings, Factory
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={
+                "COUNTRIES": Factory(load_countries),
+            },
+        )
+
+        print(app_settings.COUNTRIES)
+
+    The function is called without arguments and never by pre checks,
+    result is cached like other settings, so expensive defaults are only
+    built in processes that use them.
+    """
+
+    def __init__(self, func):
+        super().__init__(func)
+
+
+class Secret:
+    """
+    An encrypted setting, which is decrypted on first access.
+    Example:
+
+        from zero_settings import ZeroSettings, Secret, KeyfileDecryptor
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={
+                "PASSWORD": Secret("gAAAAABk...", ttl=300),
+            },
+            secret_decryptor=KeyfileDecryptor("/etc/app/secret.key"),
+        )
+
+        print(app_settings.PASSWORD)
+
+    Decrypted value is cached for ttl seconds, or like other settings if
+    ttl is None. Encrypted value is not shown in repr.
+    """
+
+    def __init__(self, ciphertext, ttl=None):
+        if isinstance(ciphertext, (str, bytes)):
+            self.ciphertext = ciphertext
+        else:
+            raise ValueError("ciphertext must be string or bytes")
+
+        if ttl is None or is_positive_number(ttl):
+            self.ttl = ttl
+        else:
+            raise ValueError("ttl must be positive number or None")
+
+    def __repr__(self):
+        return "Secret('********')"
+
+
+class Conditional:
+    """
+    A setting which its value depends on a per request context.
+    Example:
+
+        from zero_settings import ZeroSettings, Conditional
+
+        app_settings = ZeroSettings(
+            key="APP",
+            defaults={
+                "CHECKOUT": Conditional(
+                    "old",
+                    rules=[
+                        {"attr": "plan", "in": ["pro", "team"], "value": "new"},
+                        {"attr": "id", "percent": 10, "value": "new"},
+                    ],
+                ),
+            },
+        )
+
+        print(app_settings.resolve("CHECKOUT", request.user))
+
+    Rules are checked in order and value of the first matching rule is
+    returned, or default if no rule matches. "in" rules match if context
+    attr is one of values, "percent" rules match a percentage of context
+    attr values, by their crc32 bucket. Rules are compiled to lookup tables
+    once, when the setting is cached.
+    """
+
+    def __init__(self, default, rules):
+        self.default = default
+        if not isinstance(rules, (list, tuple)):
+            raise ValueError("rules must be list/tuple of dicts")
+
+        for rule in rules:
+            if not isinstance(rule, dict) or not isinstance(rule.get("attr"), str) or "value" not in rule:
+                raise ValueError("rules must be dicts with attr string and value")
+            if ("in" in rule) == ("percent" in rule):
+                raise ValueError("rules must have one of in or percent")
+            if "in" in rule and not isinstance(rule["in"], (list, tuple, set, frozenset)):
+                raise ValueError("in of rules must be list/tuple/set")
+            if "percent" in rule and not (is_positive_number(rule["percent"]) and rule["percent"] <= 100):
+                raise ValueError("percent of rules must be positive number up to 100")
+        self.rules = tuple(rules)
+
+    def compile(self, salt):
+        """
+        Return a CompiledConditional, consecutive rules of the same attr and
+        kind are merged into one dict or percent buckets table, percentages
+        are bucketed with salt, so settings do not roll out to same contexts
+        """
+        groups = []
+        for rule in self.rules:
+            is_percent = "percent" in rule
+            if not groups or groups[-1][0] != rule["attr"] or groups[-1][1] != is_percent:
+                groups.append((rule["attr"], is_percent, [_MISSING] * 100 if is_percent else {}))
+            table = groups[-1][2]
+            if is_percent:
+                for bucket in range(100):
+                    if table[bucket] is _MISSING and bucket < rule["percent"]:
+                        table[bucket] = rule["value"]
+            else:
+                for item in rule["in"]:
+                    table.setdefault(item, rule["value"])
+        return CompiledConditional(self.default, salt, [(attr, table) for attr, _, table in groups])
+
+    def __repr__(self):
+        return "Conditional(%r, rules=%r)" % (self.default, list(self.rules))
+
+
+class CompiledConditional:
+    """
+    A compiled Conditional, which is called with a context to get its value
+    """
+
+    __slots__ = ("default", "salt", "groups")
+
+    def __init__(self, default, salt, groups):
+        self.default = default
+        self.salt = salt
+        self.groups = tuple(groups)
+
+    def __call__(self, context):
+        is_mapping = isinstance(context, Mapping)
+        for attr, table in self.groups:
+            value = context.get(attr, _MISSING) if is_mapping else getattr(context, attr, _MISSING)
+            if value is _MISSING:
+                continue
+            if isinstance(table, dict):
+                try:
+                    result = table.get(value, _MISSING)
+                except TypeError:
+                    continue
+            else:
+                result = table[crc32(("%s:%s" % (self.salt, value)).encode()) % 100]
+            if result is not _MISSING:
+                return result
+        return self.default